@@ -11,11 +11,26 @@ Main components:
 
 __version__ = "0.1.0"
 
-from orsa_analysis.core.processor import DocumentProcessor
-from orsa_analysis.core.database_manager import CheckResult, DatabaseManager
-from orsa_analysis.core.versioning import VersionManager
-from orsa_analysis.core.reader import ExcelReader
-from orsa_analysis.core.orchestrator import ORSAPipeline
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# Public names are imported on first access so that the CLI can parse its
+# arguments without loading openpyxl, pandas and SQLAlchemy up front.
+_LAZY_IMPORTS = {
+    "DocumentProcessor": "orsa_analysis.core.processor",
+    "CheckResult": "orsa_analysis.core.database_manager",
+    "DatabaseManager": "orsa_analysis.core.database_manager",
+    "VersionManager": "orsa_analysis.core.versioning",
+    "ExcelReader": "orsa_analysis.core.reader",
+    "ORSAPipeline": "orsa_analysis.core.orchestrator",
+}
+
+if TYPE_CHECKING:
+    from orsa_analysis.core.processor import DocumentProcessor
+    from orsa_analysis.core.database_manager import CheckResult, DatabaseManager
+    from orsa_analysis.core.versioning import VersionManager
+    from orsa_analysis.core.reader import ExcelReader
+    from orsa_analysis.core.orchestrator import ORSAPipeline
 
 __all__ = [
     "DocumentProcessor",
@@ -25,3 +40,13 @@ __all__ = [
     "ExcelReader",
     "ORSAPipeline",
 ]
+
+
+def __getattr__(name: str):
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
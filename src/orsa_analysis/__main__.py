@@ -22,9 +22,9 @@ import logging
 import sys
 from pathlib import Path
 
-from orsa_analysis import ORSAPipeline, DatabaseManager
-from orsa_analysis.sourcing import ORSADocumentSourcer
-from orsa_analysis.reporting import ReportGenerator
+# The pipeline, sourcing and reporting modules pull in openpyxl, pandas and
+# SQLAlchemy; they are imported inside the entry functions so that argument
+# parsing (and --help) stays fast.
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +42,15 @@ def setup_logging(verbose: bool = False) -> None:
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
+    # openpyxl silently falls back to the much slower stdlib XML backend
+    from openpyxl import LXML
+
+    if not LXML:
+        logger.warning(
+            "lxml is not available, openpyxl uses the slower stdlib XML backend. "
+            "Install it with 'pip install lxml'."
+        )
+
 
 def process_from_sourcer(
     force_reprocess: bool = False,
@@ -51,7 +60,9 @@ def process_from_sourcer(
     generate_reports: bool = True,
     output_dir: str = "reports",
     template_file: str = "data/auswertungs_template.xlsx",
-    upload_reports: bool = False
+    upload_reports: bool = False,
+    workers: int = 1,
+    report_workers: int = 1
 ) -> None:
     """Process documents from ORSADocumentSourcer and write to MSSQL database.
 
@@ -64,6 +75,8 @@ def process_from_sourcer(
         output_dir: Directory for output reports (default: reports)
         template_file: Path to template file (default: data/auswertungs_template.xlsx)
         upload_reports: If True, upload reports to SharePoint (default: False)
+        workers: Number of worker processes running the checks (default: 1)
+        report_workers: Number of worker processes writing reports (default: 1)
     """
     setup_logging(verbose)
 
@@ -72,13 +85,20 @@ def process_from_sourcer(
     logger.info(f"Berichtsjahr: {berichtsjahr}")
     logger.info(f"Generate reports: {generate_reports}")
     logger.info(f"Upload reports: {upload_reports}")
+    logger.info(f"Workers: {workers}")
+
+    from orsa_analysis import ORSAPipeline, DatabaseManager
+    from orsa_analysis.sourcing import ORSADocumentSourcer
+    from orsa_analysis.reporting import ReportGenerator
 
     try:
         # Initialize database manager - it will handle credentials automatically
         db_manager = DatabaseManager()
         
         # Initialize pipeline
-        pipeline = ORSAPipeline(db_manager, force_reprocess=force_reprocess)
+        pipeline = ORSAPipeline(
+            db_manager, force_reprocess=force_reprocess, workers=workers
+        )
         
         # Initialize document sourcer
         sourcer = ORSADocumentSourcer(cred_file=credentials_file, berichtsjahr=berichtsjahr)
@@ -106,8 +126,8 @@ def process_from_sourcer(
             logger.info("GENERATING REPORTS")
             logger.info("=" * 60)
             
-            # Get source files from sourcer
-            documents = sourcer.load()
+            # Reuse the documents downloaded during processing
+            documents = sourcer.get_documents()
             source_files = {}
             for document_name, file_path, geschaeft_nr, finma_id, berichtsjahr in documents:
                 # Use FinmaID from database as the institute_id
@@ -122,7 +142,8 @@ def process_from_sourcer(
                 template_path=Path(template_file),
                 output_dir=Path(output_dir),
                 enable_upload=upload_reports,
-                download_links=download_links
+                download_links=download_links,
+                workers=report_workers
             )
             
             # Generate reports (always overwrites local files)
@@ -154,7 +175,8 @@ def generate_reports_only(
     template_file: str = "data/auswertungs_template.xlsx",
     institute_id: str = None,
     berichtsjahr: int = 2026,
-    upload_reports: bool = False
+    upload_reports: bool = False,
+    report_workers: int = 1
 ) -> None:
     """Generate reports from existing check results in database.
     
@@ -169,6 +191,7 @@ def generate_reports_only(
         institute_id: Optional specific institute to generate report for
         berichtsjahr: Reporting year for sourcing files (required)
         upload_reports: If True, upload reports to SharePoint (default: False)
+        report_workers: Number of worker processes writing reports (default: 1)
     """
     setup_logging(verbose)
 
@@ -176,6 +199,10 @@ def generate_reports_only(
     logger.info(f"Output directory: {output_dir}")
     logger.info(f"Template file: {template_file}")
 
+    from orsa_analysis import DatabaseManager
+    from orsa_analysis.sourcing import ORSADocumentSourcer
+    from orsa_analysis.reporting import ReportGenerator
+
     try:
         # Initialize database manager
         db_manager = DatabaseManager()
@@ -199,7 +226,8 @@ def generate_reports_only(
             template_path=Path(template_file),
             output_dir=Path(output_dir),
             enable_upload=upload_reports,
-            download_links=download_links
+            download_links=download_links,
+            workers=report_workers
         )
         
         # Generate reports (always overwrites local files)
@@ -228,6 +256,27 @@ def generate_reports_only(
         sys.exit(1)
 
 
+def _worker_count(value: str) -> int:
+    """Parse a worker count argument.
+
+    Args:
+        value: Command-line value
+
+    Returns:
+        Number of workers
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer of at least 1
+    """
+    try:
+        workers = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if workers < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {workers}")
+    return workers
+
+
 def main():
     """Command-line interface entry point."""
     parser = argparse.ArgumentParser(
@@ -239,6 +288,19 @@ def main():
         action="store_true",
         help="Force reprocessing of all files, ignoring cache",
     )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=_worker_count,
+        default=1,
+        help="Number of worker processes running the checks (default: 1)",
+    )
+    parser.add_argument(
+        "--report-workers",
+        type=_worker_count,
+        default=1,
+        help="Number of worker processes writing reports (default: 1)",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -308,6 +370,7 @@ def main():
             institute_id=args.institute,
             berichtsjahr=args.berichtsjahr,
             upload_reports=upload_enabled,
+            report_workers=args.report_workers,
         )
     else:
         # Run normal processing (with optional report generation)
@@ -320,6 +383,8 @@ def main():
             output_dir=args.output_dir,
             template_file=args.template,
             upload_reports=upload_enabled,
+            workers=args.workers,
+            report_workers=args.report_workers,
         )
 
 
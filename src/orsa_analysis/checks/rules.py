@@ -4,10 +4,13 @@ Each check function receives a Workbook object and returns a tuple:
 (outcome_bool, outcome_numeric, description)
 """
 
+import functools
 import logging
 import re
+from collections import Counter
+from contextvars import ContextVar
 from datetime import date, datetime
-from typing import Callable, Optional, Tuple
+from typing import Callable, List, Optional, Tuple, TypeVar
 
 from openpyxl.workbook.workbook import Workbook
 from openpyxl.utils import column_index_from_string, get_column_letter
@@ -18,11 +21,191 @@ logger = logging.getLogger(__name__)
 
 CheckFunction = Callable[[Workbook], Tuple[bool, str, str]]
 
+_T = TypeVar("_T")
+
 STR_GUT = "gut"
 STR_UNGENUEGEND = "ungenügend"
+STR_ZU_PRUEFEN = "zu prüfen"
+
+# 'Ergebnisse' only exists in the Zweigniederlassungs version of the file
+ZWEIGNIEDERLASSUNGS_SHEETS = frozenset({
+    "Ergebnisse",  # German
+    "Results",      # English
+    "Résultats"    # French
+})
+
+AVO_FINMA_SHEETS = frozenset({
+    "Ergebnisse_AVO-FINMA",  # German
+    "Results_ISO-FINMA",      # English
+    "Résultats_OS-FINMA"     # French
+})
+
+
+def _read_range(sheet, min_row: int, max_row: int, min_col: int, max_col: int) -> list[tuple]:
+    """Read a rectangular block of cell values.
+
+    Rows missing at the end of the sheet are padded with ``None`` so the
+    result always has one tuple per requested row.
+
+    Args:
+        sheet: Worksheet to read from
+        min_row: First row (1-based, inclusive)
+        max_row: Last row (inclusive)
+        min_col: First column index (1-based, inclusive)
+        max_col: Last column index (inclusive)
+
+    Returns:
+        List of row tuples containing the raw cell values
+    """
+    rows = list(
+        sheet.iter_rows(
+            min_row=min_row,
+            max_row=max_row,
+            min_col=min_col,
+            max_col=max_col,
+            values_only=True,
+        )
+    )
+    missing = (max_row - min_row + 1) - len(rows)
+    if missing > 0:
+        rows.extend([(None,) * (max_col - min_col + 1)] * missing)
+    return rows
+
+
+def _is_empty(v) -> bool:
+    """Return True for None and blank strings.
+
+    Only strings can be blank, so numbers and dates are never converted with
+    str() just to be stripped.
+    """
+    return v is None or (type(v) is str and not v.strip())
+
+
+# Results of the _per_run helpers while run_all_checks() is running, None
+# otherwise. A context variable keeps concurrent runs in other threads apart.
+_run_memo: ContextVar[Optional[dict]] = ContextVar("_run_memo", default=None)
+
+
+def _per_run(func: Callable[..., _T]) -> Callable[..., _T]:
+    """Share a helper's results between the checks of one run_all_checks() call.
+
+    Several checks derive the same values from a workbook (sheet lookups, cell
+    blocks, counts). Within run_all_checks() each value is computed once and
+    reused; the memo is dropped when the run ends, so a check called on its
+    own always reads the current cells. Failures are not memoized.
+
+    Together with _SheetBlock this means each sheet is read in a single pass
+    per run.
+
+    Args:
+        func: Helper taking the workbook plus hashable arguments
+
+    Returns:
+        The wrapped helper
+    """
+
+    @functools.wraps(func)
+    def wrapper(wb, *args):
+        memo = _run_memo.get()
+        if memo is None:
+            return func(wb, *args)
+        key = (func, wb, *args)
+        try:
+            return memo[key]
+        except KeyError:
+            value = memo[key] = func(wb, *args)
+            return value
+
+    return wrapper
+
+
+@_per_run
+def _get_sheet(wb: Workbook, german_reference: str):
+    """Return a worksheet by German reference name.
+
+    Args:
+        wb: Workbook to look in
+        german_reference: The German reference name of the sheet
+
+    Returns:
+        The worksheet object, or None if not found
+    """
+    title = SheetNameMapper(wb).get_sheet_name(german_reference)
+    return wb[title] if title is not None else None
+
+
+# Cell blocks the checks read, per German sheet name:
+# (first row, last row, first column, last column)
+_SHEET_BLOCKS = {
+    "Allgem. Angaben": (8, 18, "C", "C"),
+    "Risiken": (7, 51, "B", "E"),
+    "Massnahmen": (9, 66, "C", "G"),
+    "Szenarien": (10, 365, "C", "C"),  # All 15 scenario blocks
+    "Qual. & langfr. Risiken": (4, 39, "C", "E"),
+}
+
+
+class _SheetBlock:
+    """Values of a rectangular cell block, read from the sheet in a single pass.
+
+    Indexing cells one by one (``sheet["E26"]``) re-parses the sheet XML for
+    every lookup on read-only workbooks, so the checks read their cells from
+    blocks fetched through one ``iter_rows(values_only=True)`` call instead.
+    All four bounds are passed explicitly, so openpyxl never falls back to
+    computing ``max_row``/``max_column`` for the sheet.
+    """
+
+    __slots__ = ("min_row", "min_col", "rows")
+
+    def __init__(self, sheet, min_row: int, max_row: int, min_col: str, max_col: str):
+        self.min_row = min_row
+        self.min_col = column_index_from_string(min_col)
+        self.rows = _read_range(sheet, min_row, max_row, self.min_col, column_index_from_string(max_col))
+
+    def value(self, col: str, row: int):
+        """Return the value of a single cell, e.g. value("C", 17)."""
+        return self.rows[row - self.min_row][column_index_from_string(col) - self.min_col]
+
+    def _row_slice(self, min_row: int, max_row: int) -> list:
+        """Return the rows between two rows (inclusive), which must lie inside the block."""
+        if min_row < self.min_row or max_row >= self.min_row + len(self.rows):
+            raise IndexError(
+                f"Rows {min_row}-{max_row} are outside the block "
+                f"{self.min_row}-{self.min_row + len(self.rows) - 1}"
+            )
+        return self.rows[min_row - self.min_row:max_row - self.min_row + 1]
+
+    def column(self, col: str, min_row: int, max_row: int) -> list:
+        """Return the values of one column between two rows (inclusive)."""
+        col_offset = column_index_from_string(col) - self.min_col
+        return [row[col_offset] for row in self._row_slice(min_row, max_row)]
+
+    def rect(self, min_row: int, max_row: int, min_col: int, max_col: int) -> list:
+        """Return the row tuples of a sub-block, with 1-based column indices like _read_range()."""
+        start = min_col - self.min_col
+        stop = max_col - self.min_col + 1
+        return [row[start:stop] for row in self._row_slice(min_row, max_row)]
+
+
+@_per_run
+def _sheet_block(wb: Workbook, german_reference: str) -> Optional[_SheetBlock]:
+    """Return the block of a sheet listed in _SHEET_BLOCKS.
+
+    Args:
+        wb: Workbook to check
+        german_reference: German reference name of a sheet in _SHEET_BLOCKS
+
+    Returns:
+        The sheet's block, or None if the sheet is missing
+    """
+    sheet = _get_sheet(wb, german_reference)
+    if sheet is None:
+        return None
+    return _SheetBlock(sheet, *_SHEET_BLOCKS[german_reference])
 
 ### Allgemeine Angaben
- 
+
+@_per_run
 def _is_zweigniederlassungs_version(wb: Workbook) -> bool:
     """Detect if this is a Zweigniederlassungs version of the Excel file.
     
@@ -35,16 +218,7 @@ def _is_zweigniederlassungs_version(wb: Workbook) -> bool:
     Returns:
         True if this is a Zweigniederlassungs version, False otherwise
     """
-    sheet_names = set(wb.sheetnames)
-    
-    # Check for 'Ergebnisse' in all supported languages
-    zweigniederlassungs_sheets = {
-        "Ergebnisse",  # German
-        "Results",      # English
-        "Résultats"    # French
-    }
-    
-    return any(name in sheet_names for name in zweigniederlassungs_sheets)
+    return not ZWEIGNIEDERLASSUNGS_SHEETS.isdisjoint(wb.sheetnames)
 
 def check_orsa_version(wb: Workbook) -> Tuple[bool, str, str]:
     """Check if this is a Zweigniederlassungs or Sitzgesellschaft version.
@@ -67,13 +241,12 @@ def check_responsible_person(wb: Workbook) -> Tuple[bool, str, str]:
     This is not a real check, but needed to get the value into the report.
     """
     try:
-        mapper = SheetNameMapper(wb)
-        sheet = mapper.get_sheet("Allgem. Angaben")
+        block = _sheet_block(wb, "Allgem. Angaben")
 
-        if sheet is None:
+        if block is None:
             return False, "NA", "Das Tabellenblatt 'Allgem. Angaben' wurde in der Arbeitsmappe nicht gefunden"
 
-        value = sheet["C8"].value
+        value = block.value("C", 8)
         value = "" if value is None else str(value)
 
         return True, value, f"Verantwortliche Person aus Zelle C8: {value}" if value else "Keine verantwortliche Person in Zelle C8 angegeben"
@@ -91,34 +264,59 @@ def _to_date(v) -> Optional[date]:
     if isinstance(v, datetime):
         return v.date()
     if isinstance(v, str):
-        return datetime.strptime(v.strip(), "%d.%m.%Y").date()
+        s = v.strip()
+        # Fast path for the usual "DD.MM.YYYY"; anything else, including
+        # invalid dates, goes through strptime for the same result or error
+        if (
+            len(s) == 10
+            and s.isascii()
+            and s[2] == "."
+            and s[5] == "."
+            and s[:2].isdecimal()
+            and s[3:5].isdecimal()
+            and s[6:].isdecimal()
+        ):
+            try:
+                return date(int(s[6:]), int(s[3:5]), int(s[:2]))
+            except ValueError:
+                pass
+        return datetime.strptime(s, "%d.%m.%Y").date()
     return None
 
 
 def _months_diff(start: date, end: date) -> int:
-    months = (end.year - start.year) * 12 + (end.month - start.month)
-    if end.day < start.day:
-        months -= 1
-    return months
+    # A month only counts once its day is reached (the bool subtracts 0 or 1)
+    return (end.year - start.year) * 12 + (end.month - start.month) - (end.day < start.day)
 
 
-def check_data_recency_geschaeftsplanung(wb: Workbook) -> Tuple[bool, str, str]:
-    """
-    Check that the data which the orsa is based on is recent enough.
+def _check_data_recency(wb: Workbook, snapshot_row: int, topic: str, check_name: str) -> Tuple[bool, str, str]:
+    """Compare one snapshot date (C14-C16) with the approval date in C17.
+
+    Shared by the three recency checks, which only differ in the snapshot
+    cell and the wording. Each check keeps its own error handling so an
+    invalid snapshot date only fails the check it belongs to.
+
+    Args:
+        wb: Workbook to check
+        snapshot_row: Row of the snapshot date in column C
+        topic: Name of the data in the messages, e.g. "Szenarien"
+        check_name: Name of the calling check for the error log
+
+    Returns:
+        Tuple of (outcome, outcome_str, description)
     """
     try:
-        mapper = SheetNameMapper(wb)
-        sheet = mapper.get_sheet("Allgem. Angaben")
+        block = _sheet_block(wb, "Allgem. Angaben")
 
-        if sheet is None:
+        if block is None:
             return (
                 False,
                 STR_UNGENUEGEND,
                 "Das Tabellenblatt 'Allgem. Angaben' wurde in der Arbeitsmappe nicht gefunden",
             )
 
-        approved = _to_date(sheet["C17"].value)
-        snapshot = _to_date(sheet["C14"].value)
+        approved = _to_date(block.value("C", 17))
+        snapshot = _to_date(block.value("C", snapshot_row))
 
         if approved is None:
             return (
@@ -127,7 +325,7 @@ def check_data_recency_geschaeftsplanung(wb: Workbook) -> Tuple[bool, str, str]:
                 "Genehmigungsdatum durch Verwaltungsrat (C17) fehlt oder ist ungültig",
             )
         if snapshot is None:
-            return False, STR_UNGENUEGEND, "Stichtagsdatum der Geschäftsplanung (C14) fehlt oder ist ungültig"
+            return False, STR_UNGENUEGEND, f"Stichtagsdatum der {topic} (C{snapshot_row}) fehlt oder ist ungültig"
         if approved < snapshot:
             return False, STR_UNGENUEGEND, "Genehmigungsdatum liegt vor dem Stichtagsdatum (unlogisch)"
 
@@ -135,97 +333,34 @@ def check_data_recency_geschaeftsplanung(wb: Workbook) -> Tuple[bool, str, str]:
         ok = months <= 6
 
         if ok:
-            return True, STR_GUT, f"Aktualität der Daten für Geschäftsplanung ist ausreichend: {months} Monate zwischen Stichtag und Genehmigung (≤6 Monate erforderlich)"
+            return True, STR_GUT, f"Aktualität der Daten für {topic} ist ausreichend: {months} Monate zwischen Stichtag und Genehmigung (≤6 Monate erforderlich)"
         else:
-            return False, STR_UNGENUEGEND, f"Aktualität der Daten für Geschäftsplanung ist ungenügend: {months} Monate zwischen Stichtag und Genehmigung (max. 6 Monate erlaubt)"
+            return False, STR_UNGENUEGEND, f"Aktualität der Daten für {topic} ist ungenügend: {months} Monate zwischen Stichtag und Genehmigung (max. 6 Monate erlaubt)"
 
     except Exception as e:
-        logger.error(f"Error in check_data_recency_geschaeftsplanung: {e}")
+        logger.error(f"Error in {check_name}: {e}")
         return False, STR_UNGENUEGEND, f"Prüfung fehlgeschlagen mit Fehler: {str(e)}"
 
 
-def check_data_recency_risikoidentifikation(wb: Workbook) -> Tuple[bool, str, str]:
+def check_data_recency_geschaeftsplanung(wb: Workbook) -> Tuple[bool, str, str]:
     """
     Check that the data which the orsa is based on is recent enough.
     """
-    try:
-        mapper = SheetNameMapper(wb)
-        sheet = mapper.get_sheet("Allgem. Angaben")
-
-        if sheet is None:
-            return (
-                False,
-                STR_UNGENUEGEND,
-                "Das Tabellenblatt 'Allgem. Angaben' wurde in der Arbeitsmappe nicht gefunden",
-            )
-
-        approved = _to_date(sheet["C17"].value)
-        snapshot = _to_date(sheet["C15"].value)
-
-        if approved is None:
-            return (
-                False,
-                STR_UNGENUEGEND,
-                "Genehmigungsdatum durch Verwaltungsrat (C17) fehlt oder ist ungültig",
-            )
-        if snapshot is None:
-            return False, STR_UNGENUEGEND, "Stichtagsdatum der Risikoidentifikation (C15) fehlt oder ist ungültig"
-        if approved < snapshot:
-            return False, STR_UNGENUEGEND, "Genehmigungsdatum liegt vor dem Stichtagsdatum (unlogisch)"
+    return _check_data_recency(wb, 14, "Geschäftsplanung", "check_data_recency_geschaeftsplanung")
 
-        months = _months_diff(snapshot, approved)
-        ok = months <= 6
-
-        if ok:
-            return True, STR_GUT, f"Aktualität der Daten für Risikoidentifikation ist ausreichend: {months} Monate zwischen Stichtag und Genehmigung (≤6 Monate erforderlich)"
-        else:
-            return False, STR_UNGENUEGEND, f"Aktualität der Daten für Risikoidentifikation ist ungenügend: {months} Monate zwischen Stichtag und Genehmigung (max. 6 Monate erlaubt)"
 
-    except Exception as e:
-        logger.error(f"Error in check_data_recency_risikoidentifikation: {e}")
-        return False, STR_UNGENUEGEND, f"Prüfung fehlgeschlagen mit Fehler: {str(e)}"
+def check_data_recency_risikoidentifikation(wb: Workbook) -> Tuple[bool, str, str]:
+    """
+    Check that the data which the orsa is based on is recent enough.
+    """
+    return _check_data_recency(wb, 15, "Risikoidentifikation", "check_data_recency_risikoidentifikation")
 
 
 def check_data_recency_szenarien(wb: Workbook) -> Tuple[bool, str, str]:
     """
     Check that the data which the orsa is based on is recent enough.
     """
-    try:
-        mapper = SheetNameMapper(wb)
-        sheet = mapper.get_sheet("Allgem. Angaben")
-
-        if sheet is None:
-            return (
-                False,
-                STR_UNGENUEGEND,
-                "Das Tabellenblatt 'Allgem. Angaben' wurde in der Arbeitsmappe nicht gefunden",
-            )
-
-        approved = _to_date(sheet["C17"].value)
-        snapshot = _to_date(sheet["C16"].value)
-
-        if approved is None:
-            return (
-                False,
-                STR_UNGENUEGEND,
-                "Genehmigungsdatum durch Verwaltungsrat (C17) fehlt oder ist ungültig",
-            )
-        if snapshot is None:
-            return False, STR_UNGENUEGEND, "Stichtagsdatum der Szenarien (C16) fehlt oder ist ungültig"
-        if approved < snapshot:
-            return False, STR_UNGENUEGEND, "Genehmigungsdatum liegt vor dem Stichtagsdatum (unlogisch)"
-
-        months = _months_diff(snapshot, approved)
-        ok = months <= 6
-
-        if ok:
-            return True, STR_GUT, f"Aktualität der Daten für Szenarien ist ausreichend: {months} Monate zwischen Stichtag und Genehmigung (≤6 Monate erforderlich)"
-        else:
-            return False, STR_UNGENUEGEND, f"Aktualität der Daten für Szenarien ist ungenügend: {months} Monate zwischen Stichtag und Genehmigung (max. 6 Monate erlaubt)"
-
-    except Exception as e:
-        logger.error(f"Error in check_data_recency_szenarien: {e}")
-        return False, STR_UNGENUEGEND, f"Prüfung fehlgeschlagen mit Fehler: {str(e)}"
+    return _check_data_recency(wb, 16, "Szenarien", "check_data_recency_szenarien")
 
 
 def check_board_approved_orsa(wb: Workbook) -> Tuple[bool, str, str]:
@@ -233,14 +368,13 @@ def check_board_approved_orsa(wb: Workbook) -> Tuple[bool, str, str]:
     if _is_zweigniederlassungs_version(wb):
         return False, "Kein Rating", "Kein Rating da es sich um eine Zweigniederlassung handelt"
     
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Allgem. Angaben")
+    block = _sheet_block(wb, "Allgem. Angaben")
     
-    if sheet is None:
+    if block is None:
         return False, STR_UNGENUEGEND, "Das Tabellenblatt 'Allgem. Angaben' wurde in der Arbeitsmappe nicht gefunden"
 
-    value_who_approved = sheet["C18"].value or ""
-    is_approved_through_board = value_who_approved.startswith("(1)") or value_who_approved.startswith("(2)")
+    value_who_approved = block.value("C", 18) or ""
+    is_approved_through_board = value_who_approved.startswith(("(1)", "(2)"))
 
 
     if is_approved_through_board:
@@ -250,27 +384,29 @@ def check_board_approved_orsa(wb: Workbook) -> Tuple[bool, str, str]:
 
 ## Risiken
 
+# Rating and description per risk assessment method (Risiken E7)
+_RISIKOBEURTEILUNG_RATINGS = {
+    "(1)": ("gut", "Risikobeurteilungsmethode ist gut"),
+    "(2)": ("mangelhaft", "Risikobeurteilungsmethode ist mangelhaft"),
+    "(3)": ("ungenügend", "Risikobeurteilungsmethode ist ungenügend"),
+    "(4)": ("kein Rating", "Kein Rating für Risikobeurteilungsmethode"),
+}
+_RISIKOBEURTEILUNG_PREFIXES = tuple(_RISIKOBEURTEILUNG_RATINGS)
+
+# Risk criteria that can be selected in Risiken E10-E16
+_RISK_CRITERIA = ("(1)", "(2)", "(3)", "(4)", "(5)")
+
 def check_risikobeurteilung_method(wb: Workbook) -> Tuple[bool, str, str]:
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Risiken")
+    block = _sheet_block(wb, "Risiken")
     
-    if sheet is None:
+    if block is None:
         return False, "Prüfen", "Das Tabellenblatt 'Risiken' wurde in der Arbeitsmappe nicht gefunden"
 
-    value_method = sheet["E7"].value or ""
+    value_method = block.value("E", 7) or ""
 
-    if value_method.startswith("(1)"):
-        result_str = "gut"
-        desc = f"Risikobeurteilungsmethode ist gut: {value_method}"
-    elif value_method.startswith("(2)"):
-        result_str = "mangelhaft"
-        desc = f"Risikobeurteilungsmethode ist mangelhaft: {value_method}"
-    elif value_method.startswith("(3)"):
-        result_str = "ungenügend"
-        desc = f"Risikobeurteilungsmethode ist ungenügend: {value_method}"
-    elif value_method.startswith("(4)"):
-        result_str = "kein Rating"
-        desc = f"Kein Rating für Risikobeurteilungsmethode: {value_method}"
+    if value_method.startswith(_RISIKOBEURTEILUNG_PREFIXES):
+        result_str, desc = _RISIKOBEURTEILUNG_RATINGS[value_method[:3]]
+        desc = f"{desc}: {value_method}"
     else:
         result_str = ""
         desc = f"Ungültiger oder fehlender Wert für Risikobeurteilungsmethode in Zelle E7: '{value_method}'"
@@ -279,24 +415,21 @@ def check_risikobeurteilung_method(wb: Workbook) -> Tuple[bool, str, str]:
 
 
 def check_risk_criteria_sufficient(wb: Workbook) -> Tuple[bool, str, str]:
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Risiken")
+    block = _sheet_block(wb, "Risiken")
     
-    if sheet is None:
+    if block is None:
         return False, "mangelhaft", "Das Tabellenblatt 'Risiken' wurde in der Arbeitsmappe nicht gefunden"
 
     # Check if this is a Zweigniederlassungs version
     is_zweigniederlassung = _is_zweigniederlassungs_version(wb)
     
-    # Collect all criteria found
-    all_criteria = {"(1)", "(2)", "(3)", "(4)", "(5)"}
+    # Collect all criteria found; every criterion is a three-character prefix
     found = set()
 
-    for row in range(10, 17):
-        value = sheet[f"E{row}"].value or ""
-        for criterion in all_criteria:
-            if value.startswith(criterion):
-                found.add(criterion)
+    for value in block.column("E", 10, 16):
+        value = value or ""
+        if value.startswith(_RISK_CRITERIA):
+            found.add(value[:3])
 
     if is_zweigniederlassung:
         # For Zweigniederlassung:
@@ -350,20 +483,28 @@ def check_risk_criteria_sufficient(wb: Workbook) -> Tuple[bool, str, str]:
             return False, "mangelhaft", f"Risikokriterien sind mangelhaft (Sitzgesellschaft): {', '.join(missing)} fehlt/fehlen. Gefunden: {', '.join(sorted(found)) if found else 'keine'}"
 
 
-def _count_risk(wb: Workbook, prefix: str) -> str:
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Risiken")
-    
-    if sheet is None:
-        return "0"
+@_per_run
+def _risk_prefix_counts(wb: Workbook) -> "Counter[str]":
+    """Count the risk categories in E22:E51 of the Risiken sheet by their "(N)" prefix.
 
-    count = 0
-    for row in range(22, 52):
-        value = sheet[f"E{row}"].value or ""
-        if value.startswith(prefix):
-            count += 1
+    Args:
+        wb: Workbook to check
 
-    return str(count)
+    Returns:
+        Counter mapping the three-character prefix (e.g. "(1)") to its count
+    """
+    counts = Counter()
+    block = _sheet_block(wb, "Risiken")
+    if block is not None:
+        for value in block.column("E", 22, 51):
+            value = value or ""
+            if value.startswith("("):
+                counts[value[:3]] += 1
+    return counts
+
+
+def _count_risk(wb: Workbook, prefix: str) -> str:
+    return str(_risk_prefix_counts(wb)[prefix])
 
 
 def check_finanzmarktrisiko_count(wb: Workbook) -> Tuple[bool, str, str]:
@@ -402,19 +543,49 @@ def check_anderes_risiko_count(wb: Workbook) -> Tuple[bool, str, str]:
 
 ## Massnahmen
 
+# Categories (1)-(5) of risk mitigating measures (columns E and G)
+_MEASURE_CATEGORIES = ("(1)", "(2)", "(3)", "(4)", "(5)")
+
+# Extracts a leading number like "1" from strings starting with "(1) ..."
+_RISK_ID_RE = re.compile(r"^\s*\(?\s*(\d+)\s*\)?")
+
+@_per_run
+def _massnahmen_prefix_counts(wb: Workbook) -> Optional["Counter[Tuple[str, str]]"]:
+    """Count the "(N)" prefixes of the measures in the Massnahmen sheet.
+
+    Covers columns E and G of rows 9-38 and column F of rows 44-53 and 57-66.
+
+    Args:
+        wb: Workbook to check
+
+    Returns:
+        Counter keyed by (column letter, three-character prefix), e.g.
+        ("E", "(5)"), or None if the Massnahmen sheet is missing
+    """
+    block = _sheet_block(wb, "Massnahmen")
+    if block is None:
+        return None
+
+    counts = Counter()
+    for col, values in (
+        ("E", block.column("E", 9, 38)),
+        ("G", block.column("G", 9, 38)),
+        ("F", block.column("F", 44, 53) + block.column("F", 57, 66)),
+    ):
+        for value in values:
+            if type(value) is str and value.startswith("("):
+                counts[col, value[:3]] += 1
+    return counts
+
+
 def check_count_number_mitigating_measures(wb: Workbook) -> Tuple[bool, str, str]:
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Massnahmen")
-    
-    if sheet is None:
+    counts = _massnahmen_prefix_counts(wb)
+
+    if counts is None:
         return True, "0", "Anzahl risikobegrenzender Massnahmen: 0 (Tabellenblatt 'Massnahmen' nicht gefunden)"
 
     # Count entries with (1)-(5) in column E (rows 9-38)
-    count = 0
-    for row in range(9, 39):
-        value = str(sheet[f"E{row}"].value or "")
-        if any(value.startswith(f"({i})") for i in range(1, 6)):
-            count += 1
+    count = sum(counts["E", category] for category in _MEASURE_CATEGORIES)
 
     count_str = str(count)
     return True, count_str, f"Anzahl risikobegrenzender Massnahmen: {count_str}"
@@ -423,33 +594,27 @@ def check_count_number_mitigating_measures(wb: Workbook) -> Tuple[bool, str, str
 def check_count_number_potential_mitigating_measures(
     wb: Workbook,
 ) -> Tuple[bool, str, str]:
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Massnahmen")
-    
-    if sheet is None:
+    counts = _massnahmen_prefix_counts(wb)
+
+    if counts is None:
         return True, "0", "Anzahl potenzieller risikobegrenzender Massnahmen: 0 (Tabellenblatt 'Massnahmen' nicht gefunden)"
 
     # Count entries with (1)-(5) in column G (rows 9-38)
-    count = 0
-    for row in range(9, 39):
-        value = str(sheet[f"G{row}"].value or "")
-        if any(value.startswith(f"({i})") for i in range(1, 6)):
-            count += 1
+    count = sum(counts["G", category] for category in _MEASURE_CATEGORIES)
 
     count_str = str(count)
     return True, count_str, f"Anzahl potenzieller risikobegrenzender Massnahmen: {count_str}"
 
 
 def check_count_other_measures(wb: Workbook) -> Tuple[bool, str, str]:
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Massnahmen")
-    
-    if sheet is None:
+    block = _sheet_block(wb, "Massnahmen")
+
+    if block is None:
         return True, "0", "Anzahl sonstiger Massnahmen: 0 (Tabellenblatt 'Massnahmen' nicht gefunden)"
 
     count = 0
-    for row in range(44, 54):
-        if (sheet[f"C{row}"].value or "") != "":
+    for value in block.column("C", 44, 53):
+        if (value or "") != "":
             count += 1
 
     count_str = str(count)
@@ -457,46 +622,39 @@ def check_count_other_measures(wb: Workbook) -> Tuple[bool, str, str]:
 
 
 def check_count_potential_other_measures(wb: Workbook) -> Tuple[bool, str, str]:
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Massnahmen")
-    
-    if sheet is None:
+    block = _sheet_block(wb, "Massnahmen")
+
+    if block is None:
         return True, "0", "Anzahl potenzieller sonstiger Massnahmen: 0 (Tabellenblatt 'Massnahmen' nicht gefunden)"
 
     count = 0
-    for row in range(57, 67):
-        if (sheet[f"C{row}"].value or "") != "":
+    for value in block.column("C", 57, 66):
+        if (value or "") != "":
             count += 1
 
     count_str = str(count)
     return True, count_str, f"Anzahl potenzieller sonstiger Massnahmen: {count_str}"
 
 def check_risks_are_all_mitigated(wb: Workbook) -> Tuple[bool, str, str]:
-    mapper = SheetNameMapper(wb)
-    sheet_risiken = mapper.get_sheet("Risiken")
-    sheet_massnahmen = mapper.get_sheet("Massnahmen")
+    risiken = _sheet_block(wb, "Risiken")
+    massnahmen = _sheet_block(wb, "Massnahmen")
 
-    if sheet_risiken is None or sheet_massnahmen is None:
+    if risiken is None or massnahmen is None:
         return False, "NOK", "Tabellenblatt 'Risiken' oder 'Massnahmen' nicht gefunden"
 
     required_ids = set()
-    for row in range(22, 52):
-        if (sheet_risiken[f"C{row}"].value or "") != "":
-            rid = sheet_risiken[f"B{row}"].value
+    for rid, risk in zip(risiken.column("B", 22, 51), risiken.column("C", 22, 51), strict=True):
+        if (risk or "") != "":
             if rid is not None:
                 required_ids.add(str(rid))
 
     mitigated_ids = set()
-    # regex extracts a leading number like "1" from strings starting with "(1) ..."
-    risk_id_re = re.compile(r"^\s*\(?\s*(\d+)\s*\)?")
-
-    for row in range(9, 39):
-        value = sheet_massnahmen[f"C{row}"].value or ""
-        right_cell = sheet_massnahmen[f"D{row}"].value
-        if right_cell is None or str(right_cell).strip() == "":
+    for value, right_cell in zip(massnahmen.column("C", 9, 38), massnahmen.column("D", 9, 38), strict=True):
+        value = value or ""
+        if _is_empty(right_cell):
             continue
 
-        m = risk_id_re.match(str(value))
+        m = _RISK_ID_RE.match(value if type(value) is str else str(value))
         if m:
             mitigated_ids.add(m.group(1))
 
@@ -510,17 +668,12 @@ def check_risks_are_all_mitigated(wb: Workbook) -> Tuple[bool, str, str]:
 
 
 def check_any_nonmitigating_measures(wb: Workbook) -> Tuple[bool, str, str]:
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Massnahmen")
-    
-    if sheet is None:
+    counts = _massnahmen_prefix_counts(wb)
+
+    if counts is None:
         return True, "OK", "Tabellenblatt 'Massnahmen' nicht gefunden - keine nicht risikobegrenzenden Massnahmen vorhanden"
 
-    count = 0
-    for row in range(9, 39):
-        value = sheet[f"E{row}"].value or ""
-        if str(value).startswith("(5)"):
-            count += 1
+    count = counts["E", "(5)"]
 
     count_str = str(count)
     is_ok = count == 0
@@ -538,25 +691,14 @@ def check_count_number_mitigating_measures_other_effect(wb: Workbook) -> Tuple[b
     
     Returns the total count (sum of E and G)
     """
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Massnahmen")
+    counts = _massnahmen_prefix_counts(wb)
     
-    if sheet is None:
+    if counts is None:
         return True, "0", "Anzahl Massnahmen mit anderer Wirkung: 0 (Tabellenblatt 'Massnahmen' nicht gefunden)"
     
-    # Count (5) in column E (rows 9-38)
-    count_e = 0
-    for row in range(9, 39):
-        value = str(sheet[f"E{row}"].value or "")
-        if value.startswith("(5)"):
-            count_e += 1
-    
-    # Count (5) in column G (rows 9-38)
-    count_g = 0
-    for row in range(9, 39):
-        value = str(sheet[f"G{row}"].value or "")
-        if value.startswith("(5)"):
-            count_g += 1
+    # Count (5) in columns E and G (rows 9-38)
+    count_e = counts["E", "(5)"]
+    count_g = counts["G", "(5)"]
     
     total = count_e + count_g
     result_str = str(total)
@@ -568,25 +710,14 @@ def check_count_number_mitigating_measures_risk_accepted(wb: Workbook) -> Tuple[
     
     Returns the total count (sum of E and G)
     """
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Massnahmen")
+    counts = _massnahmen_prefix_counts(wb)
     
-    if sheet is None:
+    if counts is None:
         return True, "0", "Anzahl akzeptierter Risiken: 0 (Tabellenblatt 'Massnahmen' nicht gefunden)"
     
-    # Count (6) in column E (rows 9-38)
-    count_e = 0
-    for row in range(9, 39):
-        value = str(sheet[f"E{row}"].value or "")
-        if value.startswith("(6)"):
-            count_e += 1
-    
-    # Count (6) in column G (rows 9-38)
-    count_g = 0
-    for row in range(9, 39):
-        value = str(sheet[f"G{row}"].value or "")
-        if value.startswith("(6)"):
-            count_g += 1
+    # Count (6) in columns E and G (rows 9-38)
+    count_e = counts["E", "(6)"]
+    count_g = counts["G", "(6)"]
     
     total = count_e + count_g
     result_str = str(total)
@@ -598,281 +729,224 @@ def check_count_number_other_measures_other_effect(wb: Workbook) -> Tuple[bool,
     
     Returns the total count.
     """
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Massnahmen")
+    counts = _massnahmen_prefix_counts(wb)
     
-    if sheet is None:
+    if counts is None:
         return True, "0", "Anzahl sonstiger Massnahmen mit anderer Wirkung: 0 (Tabellenblatt 'Massnahmen' nicht gefunden)"
     
-    count = 0
-    # Count (4) in column F rows 44-53
-    for row in range(44, 54):
-        value = str(sheet[f"F{row}"].value or "")
-        if value.startswith("(4)"):
-            count += 1
-    
-    # Count (4) in column F rows 57-66
-    for row in range(57, 67):
-        value = str(sheet[f"F{row}"].value or "")
-        if value.startswith("(4)"):
-            count += 1
+    # Count (4) in column F rows 44-53 and 57-66
+    count = counts["F", "(4)"]
     
     count_str = str(count)
     return True, count_str, f"Anzahl sonstiger Massnahmen mit anderer Wirkung: {count_str}"
 
 #### Szenarien
-def _scenario_type_cells() -> list[str]:
-    return [
-        "C10",
-        "C34",
-        "C58",
-        "C82",
-        "C106",
-        "C130",
-        "C154",
-        "C178",
-        "C202",
-        "C226",
-        "C250",
-        "C274",
-        "C298",
-        "C322",
-        "C346",
-    ]
+# Rows of the 15 scenario blocks in column C of the Szenarien sheet, 24 rows
+# apart: (type cell, first of five event rows, first of ten risk rows)
+_SCENARIO_ROWS: Tuple[Tuple[int, int, int], ...] = tuple(
+    (10 + i * 24, 14 + i * 24, 20 + i * 24) for i in range(15)
+)
+
+# First row of the Szenarien block; the column values are indexed from it
+_SZENARIEN_FIRST_ROW = _SHEET_BLOCKS["Szenarien"][0]
+
+
+def _szenarien_column(wb: Workbook) -> Optional[list]:
+    """Return column C of all scenario blocks (index 0 is row 10), or None."""
+    block = _sheet_block(wb, "Szenarien")
+    if block is None:
+        return None
+    return block.column("C", _SZENARIEN_FIRST_ROW, _SCENARIO_ROWS[-1][2] + 9)
+
+
+@_per_run
+def _defined_scenarios(wb: Workbook) -> Tuple[int, ...]:
+    """Return the indices of the defined scenarios.
+
+    The scenario result checks only look at the result columns of scenarios
+    whose type cell is filled.
+
+    Args:
+        wb: Workbook to check
+
+    Returns:
+        Tuple of zero-based scenario indices
+
+    Raises:
+        ValueError: If the Szenarien sheet is missing; run_check() reports
+            this as "zu prüfen"
+    """
+    column = _szenarien_column(wb)
+    if column is None:
+        raise ValueError("Das Tabellenblatt 'Szenarien' wurde in der Arbeitsmappe nicht gefunden")
+    return tuple(
+        i
+        for i, (type_row, _, _) in enumerate(_SCENARIO_ROWS)
+        if (column[type_row - _SZENARIEN_FIRST_ROW] or "") != ""
+    )
+
+
+@_per_run
+def _scenario_type_tally(wb: Workbook) -> Optional[Tuple[int, "Counter[str]"]]:
+    """Tally the 15 scenario type cells of the Szenarien sheet.
+
+    Args:
+        wb: Workbook to check
+
+    Returns:
+        Tuple of (number of filled type cells, Counter of the three-character
+        "(N)" prefixes), or None if the Szenarien sheet is missing
+    """
+    column = _szenarien_column(wb)
+    if column is None:
+        return None
+
+    total = 0
+    types = Counter()
+    for type_row, _, _ in _SCENARIO_ROWS:
+        value = column[type_row - _SZENARIEN_FIRST_ROW]
+        if (value or "") != "":
+            total += 1
+            if type(value) is str:
+                types[value[:3]] += 1
+    return total, types
 
 
 def check_count_all_scenarios(wb: Workbook) -> Tuple[bool, str, str]:
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Szenarien")
-    
-    if sheet is None:
-        return True, "0", "Anzahl aller definierten Szenarien: 0 (Tabellenblatt 'Szenarien' nicht gefunden)"
+    tally = _scenario_type_tally(wb)
 
-    count = 0
-    for addr in _scenario_type_cells():
-        if (sheet[addr].value or "") != "":
-            count += 1
+    if tally is None:
+        return True, "0", "Anzahl aller definierten Szenarien: 0 (Tabellenblatt 'Szenarien' nicht gefunden)"
 
-    count_str = str(count)
+    count_str = str(tally[0])
     return True, count_str, f"Anzahl aller definierten Szenarien: {count_str}"
 
 
 def check_count_advers_scenarios(wb: Workbook) -> Tuple[bool, str, str]:
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Szenarien")
-    
-    if sheet is None:
-        return True, "0", "Anzahl adverser Szenarien (Typ (1)): 0 (Tabellenblatt 'Szenarien' nicht gefunden)"
+    tally = _scenario_type_tally(wb)
 
-    count = 0
-    for addr in _scenario_type_cells():
-        value = str(sheet[addr].value or "")
-        if value.startswith("(1)"):
-            count += 1
+    if tally is None:
+        return True, "0", "Anzahl adverser Szenarien (Typ (1)): 0 (Tabellenblatt 'Szenarien' nicht gefunden)"
 
-    count_str = str(count)
+    count_str = str(tally[1]["(1)"])
     return True, count_str, f"Anzahl adverser Szenarien (Typ (1)): {count_str}"
 
 
 def check_count_existenzbedrohend_scenarios(wb: Workbook) -> Tuple[bool, str, str]:
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Szenarien")
-    
-    if sheet is None:
-        return True, "0", "Anzahl existenzbedrohender Szenarien (Typ (2)): 0 (Tabellenblatt 'Szenarien' nicht gefunden)"
+    tally = _scenario_type_tally(wb)
 
-    count = 0
-    for addr in _scenario_type_cells():
-        value = str(sheet[addr].value or "")
-        if value.startswith("(2)"):
-            count += 1
+    if tally is None:
+        return True, "0", "Anzahl existenzbedrohender Szenarien (Typ (2)): 0 (Tabellenblatt 'Szenarien' nicht gefunden)"
 
-    count_str = str(count)
+    count_str = str(tally[1]["(2)"])
     return True, count_str, f"Anzahl existenzbedrohender Szenarien (Typ (2)): {count_str}"
 
 
 def check_count_other_scenarios(wb: Workbook) -> Tuple[bool, str, str]:
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Szenarien")
-    
-    if sheet is None:
-        return True, "0", "Anzahl sonstiger Szenarien (Typ (3)): 0 (Tabellenblatt 'Szenarien' nicht gefunden)"
+    tally = _scenario_type_tally(wb)
 
-    count = 0
-    for addr in _scenario_type_cells():
-        value = str(sheet[addr].value or "")
-        if value.startswith("(3)"):
-            count += 1
+    if tally is None:
+        return True, "0", "Anzahl sonstiger Szenarien (Typ (3)): 0 (Tabellenblatt 'Szenarien' nicht gefunden)"
 
-    count_str = str(count)
+    count_str = str(tally[1]["(3)"])
     return True, count_str, f"Anzahl sonstiger Szenarien (Typ (3)): {count_str}"
 
-def check_every_scenario_has_event(wb: Workbook) -> Tuple[bool, str, str]:
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Szenarien")
-    
-    if sheet is None:
-        return True, "OK", "Tabellenblatt 'Szenarien' nicht gefunden"
+@_per_run
+def _scenario_stats(wb: Workbook) -> Optional[List[Tuple[int, int]]]:
+    """Count the events and risks of each defined scenario.
+
+    Every scenario block spans 24 rows of column C: the type in row 10, up
+    to five events in rows 14-18 and up to ten risks in rows 20-29 (offset
+    by 24 rows per scenario).
+
+    Args:
+        wb: Workbook to check
 
-    ok = True
-    for i, type_addr in enumerate(_scenario_type_cells()):
-        scenario_type = sheet[type_addr].value or ""
-        if scenario_type == "":
+    Returns:
+        List of (event_count, risk_count) tuples for the scenarios with a
+        filled type cell, or None if the Szenarien sheet is missing
+    """
+    column = _szenarien_column(wb)
+    if column is None:
+        return None
+
+    stats = []
+    for type_row, event_row, risk_row in _SCENARIO_ROWS:
+        if (column[type_row - _SZENARIEN_FIRST_ROW] or "") == "":
             continue
+        events = column[event_row - _SZENARIEN_FIRST_ROW:event_row - _SZENARIEN_FIRST_ROW + 5]
+        risks = column[risk_row - _SZENARIEN_FIRST_ROW:risk_row - _SZENARIEN_FIRST_ROW + 10]
+        event_count = sum(1 for v in events if (v or "") != "")
+        risk_count = sum(1 for v in risks if (v or "") != "")
+        stats.append((event_count, risk_count))
+    return stats
 
-        start_row = 14 + i * 24
-        has_event = False
-        for r in range(start_row, start_row + 5):  # C14-C18, then +24 each scenario
-            if (sheet[f"C{r}"].value or "") != "":
-                has_event = True
-                break
 
-        if not has_event:
-            ok = False
-            break
+def check_every_scenario_has_event(wb: Workbook) -> Tuple[bool, str, str]:
+    stats = _scenario_stats(wb)
 
-    if ok:
+    if stats is None:
+        return True, "OK", "Tabellenblatt 'Szenarien' nicht gefunden"
+
+    if all(event_count > 0 for event_count, _ in stats):
         return True, "OK", "Jedes definierte Szenario hat mindestens ein zugeordnetes Ereignis"
     return False, "NOK", "Mindestens ein Szenario hat kein zugeordnetes Ereignis."
 
 def check_count_scenarios_only_one_event(wb: Workbook) -> Tuple[bool, str, str]:
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Szenarien")
-    
-    if sheet is None:
-        return True, "0", "Anzahl Szenarien mit genau einem Ereignis: 0 (Tabellenblatt 'Szenarien' nicht gefunden)"
-
-    count = 0
-    for i, type_addr in enumerate(_scenario_type_cells()):
-        scenario_type = sheet[type_addr].value or ""
-        if scenario_type == "":
-            continue
+    stats = _scenario_stats(wb)
 
-        start_row = 14 + i * 24
-        event_count = 0
-        for r in range(start_row, start_row + 5):
-            if (sheet[f"C{r}"].value or "") != "":
-                event_count += 1
-
-        if event_count == 1:
-            count += 1
+    if stats is None:
+        return True, "0", "Anzahl Szenarien mit genau einem Ereignis: 0 (Tabellenblatt 'Szenarien' nicht gefunden)"
 
-    count_str = str(count)
+    count_str = str(sum(1 for event_count, _ in stats if event_count == 1))
     return True, count_str, f"Anzahl Szenarien mit genau einem Ereignis: {count_str}"
 
 def check_count_scenarios_multiple_events(wb: Workbook) -> Tuple[bool, str, str]:
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Szenarien")
-    
-    if sheet is None:
-        return True, "0", "Anzahl Szenarien mit mehreren Ereignissen: 0 (Tabellenblatt 'Szenarien' nicht gefunden)"
+    stats = _scenario_stats(wb)
 
-    count = 0
-    for i, type_addr in enumerate(_scenario_type_cells()):
-        scenario_type = sheet[type_addr].value or ""
-        if scenario_type == "":
-            continue
-
-        start_row = 14 + i * 24
-        event_count = 0
-        for r in range(start_row, start_row + 5):
-            if (sheet[f"C{r}"].value or "") != "":
-                event_count += 1
-
-        if event_count > 1:
-            count += 1
+    if stats is None:
+        return True, "0", "Anzahl Szenarien mit mehreren Ereignissen: 0 (Tabellenblatt 'Szenarien' nicht gefunden)"
 
-    count_str = str(count)
+    count_str = str(sum(1 for event_count, _ in stats if event_count > 1))
     return True, count_str, f"Anzahl Szenarien mit mehreren Ereignissen: {count_str}"
 
 def check_every_scenario_has_risk(wb: Workbook) -> Tuple[bool, str, str]:
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Szenarien")
-    
-    if sheet is None:
-        return True, "OK", "Tabellenblatt 'Szenarien' nicht gefunden"
-
-    ok = True
-    for i, type_addr in enumerate(_scenario_type_cells()):
-        scenario_type = sheet[type_addr].value or ""
-        if scenario_type == "":
-            continue
+    stats = _scenario_stats(wb)
 
-        start_row = 20 + i * 24  # C20-C29, then +24 each scenario
-        has_risk = False
-        for r in range(start_row, start_row + 10):
-            if (sheet[f"C{r}"].value or "") != "":
-                has_risk = True
-                break
-
-        if not has_risk:
-            ok = False
-            break
+    if stats is None:
+        return True, "OK", "Tabellenblatt 'Szenarien' nicht gefunden"
 
-    if ok:
+    if all(risk_count > 0 for _, risk_count in stats):
         return True, "OK", "Jedes definierte Szenario hat mindestens ein zugeordnetes Risiko"
     return False, "NOK", "Mindestens ein Szenario hat kein zugeordnetes Risiko."
 
 def check_count_scenarios_only_one_risk(wb: Workbook) -> Tuple[bool, str, str]:
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Szenarien")
-    
-    if sheet is None:
-        return True, "0", "Anzahl Szenarien mit genau einem Risiko: 0 (Tabellenblatt 'Szenarien' nicht gefunden)"
-
-    count = 0
-    for i, type_addr in enumerate(_scenario_type_cells()):
-        scenario_type = sheet[type_addr].value or ""
-        if scenario_type == "":
-            continue
+    stats = _scenario_stats(wb)
 
-        start_row = 20 + i * 24
-        risk_count = 0
-        for r in range(start_row, start_row + 10):
-            if (sheet[f"C{r}"].value or "") != "":
-                risk_count += 1
-
-        if risk_count == 1:
-            count += 1
+    if stats is None:
+        return True, "0", "Anzahl Szenarien mit genau einem Risiko: 0 (Tabellenblatt 'Szenarien' nicht gefunden)"
 
-    count_str = str(count)
+    count_str = str(sum(1 for _, risk_count in stats if risk_count == 1))
     return True, count_str, f"Anzahl Szenarien mit genau einem Risiko: {count_str}"
 
 def check_count_scenrios_multiple_risks(wb: Workbook) -> Tuple[bool, str, str]:
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Szenarien")
-    
-    if sheet is None:
-        return True, "0", "Anzahl Szenarien mit mehreren Risiken: 0 (Tabellenblatt 'Szenarien' nicht gefunden)"
+    stats = _scenario_stats(wb)
 
-    count = 0
-    for i, type_addr in enumerate(_scenario_type_cells()):
-        scenario_type = sheet[type_addr].value or ""
-        if scenario_type == "":
-            continue
-
-        start_row = 20 + i * 24
-        risk_count = 0
-        for r in range(start_row, start_row + 10):
-            if (sheet[f"C{r}"].value or "") != "":
-                risk_count += 1
-
-        if risk_count > 1:
-            count += 1
+    if stats is None:
+        return True, "0", "Anzahl Szenarien mit mehreren Risiken: 0 (Tabellenblatt 'Szenarien' nicht gefunden)"
 
-    count_str = str(count)
+    count_str = str(sum(1 for _, risk_count in stats if risk_count > 1))
     return True, count_str, f"Anzahl Szenarien mit mehreren Risiken: {count_str}"
 
 ### Resultate AVO-FINMA / IFRS
 
-def _is_any_filled(sheet, cells: list[str]) -> bool:
+def _is_any_filled(sheet, row: int, start_col: str, end_col: str) -> bool:
     if sheet is None:
         return False
-    for addr in cells:
-        v = sheet[addr].value
-        if v is not None and str(v).strip() != "":
-            return True
-    return False
+    (values,) = _read_range(
+        sheet, row, row, column_index_from_string(start_col), column_index_from_string(end_col)
+    )
+    return not all(_is_empty(v) for v in values)
   
 def _is_avo_finma_sheet(sheet_title: str) -> bool:
     """Check if a sheet title corresponds to the AVO-FINMA results sheet.
@@ -885,31 +959,33 @@ def _is_avo_finma_sheet(sheet_title: str) -> bool:
     Returns:
         True if this is an AVO-FINMA results sheet, False otherwise
     """
-    avo_finma_sheets = {
-        "Ergebnisse_AVO-FINMA",  # German
-        "Results_ISO-FINMA",      # English
-        "Résultats_OS-FINMA"     # French
-    }
-    return sheet_title in avo_finma_sheets
+    return sheet_title in AVO_FINMA_SHEETS
 
+@_per_run
 def _get_filled_results_sheet(wb: Workbook) -> Tuple[bool, str, str, object]:
-    mapper = SheetNameMapper(wb)
-    
+    """Return the results sheet that holds the figures.
+
+    Args:
+        wb: Workbook to check
+
+    Returns:
+        Tuple of (ok, outcome_str, details_str, results_sheet or None)
+    """
     # Check if this is a Zweigniederlassungs version
     if _is_zweigniederlassungs_version(wb):
-        sheet_ergebnisse = mapper.get_sheet("Ergebnisse")
+        sheet_ergebnisse = _get_sheet(wb, "Ergebnisse")
         if sheet_ergebnisse is None:
             msg = "Error: Ergebnisse sheet not found in Zweigniederlassungs version"
             return False, msg, msg, None
         return True, "OK", "OK", sheet_ergebnisse
     
     # Standard version logic
-    sheet_avo = mapper.get_sheet("Ergebnisse_AVO-FINMA")
-    sheet_ifrs = mapper.get_sheet("Ergebnisse_IFRS")
+    sheet_avo = _get_sheet(wb, "Ergebnisse_AVO-FINMA")
+    sheet_ifrs = _get_sheet(wb, "Ergebnisse_IFRS")
 
-    check_cells = ["E26", "F26", "G26"]
-    avo_filled = _is_any_filled(sheet_avo, check_cells)
-    ifrs_filled = _is_any_filled(sheet_ifrs, check_cells)
+    # E26:G26 is filled on exactly one of the two results sheets
+    avo_filled = _is_any_filled(sheet_avo, 26, "E", "G")
+    ifrs_filled = _is_any_filled(sheet_ifrs, 26, "E", "G")
 
     if avo_filled and ifrs_filled:
         msg = "Error: Both result sheets are filled out (AVO-FINMA and IFRS)"
@@ -922,36 +998,124 @@ def _get_filled_results_sheet(wb: Workbook) -> Tuple[bool, str, str, object]:
     return True, "OK", "OK", (sheet_avo if avo_filled else sheet_ifrs)
 
 
-def _range_has_no_empty_cells(sheet, start_col: str, end_col: str, start_row: int, end_row: int) -> bool:
-    for row in range(start_row, end_row + 1):
-        for col_ord in range(ord(start_col), ord(end_col) + 1):
-            addr = f"{chr(col_ord)}{row}"
-            v = sheet[addr].value
-            if v is None or str(v).strip() == "":
+def _block_has_no_empty_cells(block: _SheetBlock, min_row: int, max_row: int, min_col: int, max_col: int) -> bool:
+    # _is_empty() inlined: this scan covers most cells read by the results checks
+    for values in block.rect(min_row, max_row, min_col, max_col):
+        for v in values:
+            if v is None or (type(v) is str and not v.strip()):
                 return False
     return True
 
+
+def _range_has_no_empty_cells(block: _SheetBlock, start_col: str, end_col: str, start_row: int, end_row: int) -> bool:
+    return _block_has_no_empty_cells(
+        block, start_row, end_row, column_index_from_string(start_col), column_index_from_string(end_col)
+    )
+
+
+# Row ranges of each results topic per layout of the filled results sheet. The
+# base case uses columns E-G, each scenario its own three columns on the same rows.
+_RESULT_ROWS = {
+    "zweig": {
+        "business_planning": ((10, 20), (23, 30)),
+        "tied_assets": ((38, 40),),
+        "provisions": ((60, 60),),
+        "other_perspective": ((63, 63), (66, 66), (69, 69)),
+        "liquidity": ((66, 66),),
+    },
+    "avo": {
+        "business_planning": ((11, 21), (24, 35)),
+        "sst": ((42, 45),),
+        "tied_assets": ((49, 51),),
+        "provisions": ((71, 71),),
+        "other_perspective": ((74, 74), (77, 77), (82, 84), (86, 86), (89, 89), (93, 93), (97, 97)),
+        "liquidity": ((86, 86),),
+    },
+    "ifrs": {
+        "business_planning": ((11, 23), (26, 38)),
+        "sst": ((44, 47),),
+        "tied_assets": ((51, 54),),
+        "provisions": ((73, 73),),
+        "other_perspective": ((76, 76), (79, 79), (84, 86), (88, 88), (91, 91), (95, 95), (99, 99)),
+        "liquidity": ((88, 88),),
+    },
+}
+
+
+# Cells the results checks read from the filled results sheet: base columns E-G
+# and the scenario columns K-CS, up to the last other-perspective row
+_RESULTS_BLOCK = (10, 99, "E", "CS")
+
+@_per_run
+def _results_block(wb: Workbook, results_sheet) -> _SheetBlock:
+    """Return the results cells of the filled results sheet.
+
+    Args:
+        wb: Workbook to check
+        results_sheet: Results sheet returned by _get_filled_results_sheet
+
+    Returns:
+        Block of the values in _RESULTS_BLOCK
+    """
+    return _SheetBlock(results_sheet, *_RESULTS_BLOCK)
+
+
+def _results_layout(wb: Workbook, results_sheet) -> str:
+    """Return the layout key of the filled results sheet for _RESULT_ROWS.
+
+    Args:
+        wb: Workbook to check
+        results_sheet: Results sheet returned by _get_filled_results_sheet
+
+    Returns:
+        "zweig" for the Zweigniederlassungs version, otherwise "avo" or "ifrs"
+    """
+    if _is_zweigniederlassungs_version(wb):
+        return "zweig"
+    return "avo" if _is_avo_finma_sheet(results_sheet.title) else "ifrs"
+
+
+def _rows_have_no_empty_cells(block: _SheetBlock, row_ranges, min_col: int, max_col: int) -> bool:
+    return all(
+        _block_has_no_empty_cells(block, first_row, last_row, min_col, max_col)
+        for first_row, last_row in row_ranges
+    )
+
+
+def _first_partial_row(block: _SheetBlock, row_ranges, min_col: int) -> Optional[int]:
+    """Return the first row whose first year is filled but a later one is not.
+
+    Args:
+        block: Results block
+        row_ranges: (first_row, last_row) ranges to inspect
+        min_col: Column index of the first of the three year columns
+
+    Returns:
+        Row number of the first partially filled row, or None
+    """
+    for first_row, last_row in row_ranges:
+        rows = block.rect(first_row, last_row, min_col, min_col + 2)
+        for row, (first_val, second_val, third_val) in enumerate(rows, start=first_row):
+            if not _is_empty(first_val) and (_is_empty(second_val) or _is_empty(third_val)):
+                return row
+    return None
+
+
 def check_business_planning_filled_three_years(wb: Workbook) -> Tuple[bool, str, str]:
     ok, outcome_str, details_str, sheet = _get_filled_results_sheet(wb)
     if not ok:
         return False, outcome_str, details_str
 
-    # Check if Zweigniederlassungs version
-    is_zweigniederlassung = _is_zweigniederlassungs_version(wb)
-    is_avo = _is_avo_finma_sheet(sheet.title)
+    layout = _results_layout(wb, sheet)
+    block = _results_block(wb, sheet)
 
-    if is_zweigniederlassung:
-        # Zweigniederlassungs version: E10-G20 and E23-E30
-        ok_1 = _range_has_no_empty_cells(sheet, "E", "G", 10, 20)
-        ok_2 = _range_has_no_empty_cells(sheet, "E", "E", 23, 30)
-    elif is_avo:
-        ok_1 = _range_has_no_empty_cells(sheet, "E", "G", 11, 21)
-        ok_2 = _range_has_no_empty_cells(sheet, "E", "G", 24, 35)
+    if layout == "zweig":
+        # Zweigniederlassungs version: E10-G20 but only column E for rows 23-30
+        ok = _range_has_no_empty_cells(block, "E", "G", 10, 20) and _range_has_no_empty_cells(block, "E", "E", 23, 30)
     else:
-        ok_1 = _range_has_no_empty_cells(sheet, "E", "G", 11, 23)
-        ok_2 = _range_has_no_empty_cells(sheet, "E", "G", 26, 38)
+        ok = _rows_have_no_empty_cells(block, _RESULT_ROWS[layout]["business_planning"], 5, 7)
 
-    if ok_1 and ok_2:
+    if ok:
         return True, "OK", "Geschäftsplanung ist vollständig für drei Jahre ausgefüllt"
 
     return False, "Prüfen", "Geschäftsplanung ist nicht vollständig für drei Jahre ausgefüllt."
@@ -966,14 +1130,7 @@ def check_sst_filled_three_years(wb: Workbook) -> Tuple[bool, str, str]:
     if not ok:
         return False, outcome_str, details_str
 
-    is_avo = _is_avo_finma_sheet(sheet.title)
-
-    if is_avo:
-        ok = _range_has_no_empty_cells(sheet, "E", "G", 42, 45)
-    else:
-        ok = _range_has_no_empty_cells(sheet, "E", "G", 44, 47)
-
-    if ok:
+    if _rows_have_no_empty_cells(_results_block(wb, sheet), _RESULT_ROWS[_results_layout(wb, sheet)]["sst"], 5, 7):
         return True, "OK", "SST-Daten sind vollständig für drei Jahre ausgefüllt"
 
     return False, "Prüfen", "SST-Daten sind nicht vollständig für drei Jahre ausgefüllt."
@@ -983,19 +1140,7 @@ def check_tied_assets_filled_three_years(wb: Workbook) -> Tuple[bool, str, str]:
     if not ok:
         return False, outcome_str, details_str
 
-    # Check if Zweigniederlassungs version
-    is_zweigniederlassung = _is_zweigniederlassungs_version(wb)
-    is_avo = _is_avo_finma_sheet(sheet.title)
-
-    if is_zweigniederlassung:
-        # Zweigniederlassungs version: E38 to G40
-        ok = _range_has_no_empty_cells(sheet, "E", "G", 38, 40)
-    elif is_avo:
-        ok = _range_has_no_empty_cells(sheet, "E", "G", 49, 51)
-    else:
-        ok = _range_has_no_empty_cells(sheet, "E", "G", 51, 54)
-
-    if ok:
+    if _rows_have_no_empty_cells(_results_block(wb, sheet), _RESULT_ROWS[_results_layout(wb, sheet)]["tied_assets"], 5, 7):
         return True, "OK", "Gebundenes Vermögen ist vollständig für drei Jahre ausgefüllt"
 
     return False, "Prüfen", "Gebundenes Vermögen ist nicht vollständig für drei Jahre ausgefüllt."
@@ -1004,19 +1149,7 @@ def check_provisions_filled_three_years(wb: Workbook) -> Tuple[bool, str, str]:
     if not ok:
         return False, outcome_str, details_str
 
-    # Check if Zweigniederlassungs version
-    is_zweigniederlassung = _is_zweigniederlassungs_version(wb)
-    is_avo = _is_avo_finma_sheet(sheet.title)
-
-    if is_zweigniederlassung:
-        # Zweigniederlassungs version: E60 to G60
-        ok_range = _range_has_no_empty_cells(sheet, "E", "G", 60, 60)
-    elif is_avo:
-        ok_range = _range_has_no_empty_cells(sheet, "E", "G", 71, 71)
-    else:
-        ok_range = _range_has_no_empty_cells(sheet, "E", "G", 73, 73)
-
-    if ok_range:
+    if _rows_have_no_empty_cells(_results_block(wb, sheet), _RESULT_ROWS[_results_layout(wb, sheet)]["provisions"], 5, 7):
         return True, "OK", "Rückstellungen sind vollständig für drei Jahre ausgefüllt"
 
     return False, "Prüfen", "Rückstellungen sind nicht vollständig für drei Jahre ausgefüllt."
@@ -1026,50 +1159,9 @@ def check_other_perspective_filled_three_years(wb: Workbook) -> Tuple[bool, str,
     if not ok:
         return False, outcome_str, details_str
 
-    # Check if Zweigniederlassungs version
-    is_zweigniederlassung = _is_zweigniederlassungs_version(wb)
-    is_avo = _is_avo_finma_sheet(sheet.title)
-    
-    if is_zweigniederlassung:
-        # Zweigniederlassungs version: E63 to G63, E66 to G66, E69 to G69
-        row_ranges = [(63, 63), (66, 66), (69, 69)]
-    else:
-        shift = 0 if is_avo else 2
-        row_ranges = [
-            (74, 74),
-            (77, 77),
-            (82, 84),
-            (86, 86),
-            (89, 89),
-            (93, 93),
-            (97, 97),
-        ]
-
-    for r1, r2 in row_ranges:
-        if is_zweigniederlassung:
-            for row in range(r1, r2 + 1):
-                e_val = sheet[f"E{row}"].value
-                f_val = sheet[f"F{row}"].value
-                g_val = sheet[f"G{row}"].value
-
-                e_filled = e_val is not None and str(e_val).strip() != ""
-                f_filled = f_val is not None and str(f_val).strip() != ""
-                g_filled = g_val is not None and str(g_val).strip() != ""
-
-                if e_filled and not (f_filled and g_filled):
-                    return False, "Prüfen", f"Andere Perspektive (Zeile {row}): nur teilweise ausgefüllt (Spalte E ausgefüllt, aber F und/oder G fehlen)."
-        else:
-            for row in range(r1 + shift, r2 + shift + 1):
-                e_val = sheet[f"E{row}"].value
-                f_val = sheet[f"F{row}"].value
-                g_val = sheet[f"G{row}"].value
-
-                e_filled = e_val is not None and str(e_val).strip() != ""
-                f_filled = f_val is not None and str(f_val).strip() != ""
-                g_filled = g_val is not None and str(g_val).strip() != ""
-
-                if e_filled and not (f_filled and g_filled):
-                    return False, "Prüfen", f"Andere Perspektive (Zeile {row}): nur teilweise ausgefüllt (Spalte E ausgefüllt, aber F und/oder G fehlen)."
+    row = _first_partial_row(_results_block(wb, sheet), _RESULT_ROWS[_results_layout(wb, sheet)]["other_perspective"], 5)
+    if row is not None:
+        return False, "Prüfen", f"Andere Perspektive (Zeile {row}): nur teilweise ausgefüllt (Spalte E ausgefüllt, aber F und/oder G fehlen)."
 
     return True, "OK", "Andere Perspektive ist konsistent ausgefüllt (alle Zeilen sind entweder komplett für drei Jahre ausgefüllt oder komplett leer)"
 
@@ -1085,42 +1177,41 @@ def check_liquidity_filled_three_years(wb: Workbook) -> Tuple[bool, str, str]:
     if not ok:
         return False, outcome_str, details_str
 
-    # Check if Zweigniederlassungs version
-    is_zweigniederlassung = _is_zweigniederlassungs_version(wb)
-    is_avo = _is_avo_finma_sheet(sheet.title)
-
-    if is_zweigniederlassung:
-        # Zweigniederlassungs version: line 66
-        ok = _range_has_no_empty_cells(sheet, "E", "G", 66, 66)
-    elif is_avo:
-        # AVO-FINMA: line 86
-        ok = _range_has_no_empty_cells(sheet, "E", "G", 86, 86)
-    else:
-        # IFRS: line 88
-        ok = _range_has_no_empty_cells(sheet, "E", "G", 88, 88)
-
-    if ok:
+    if _rows_have_no_empty_cells(_results_block(wb, sheet), _RESULT_ROWS[_results_layout(wb, sheet)]["liquidity"], 5, 7):
         return True, "Ja", "Liquidität ist vollständig für drei Jahre ausgefüllt"
 
     return False, "Nein", "Liquidität ist nicht vollständig für drei Jahre ausgefüllt"
 
 
+# Result columns of each scenario: three year columns starting at K, 6 apart
+_SCENARIO_COL_INDICES: Tuple[Tuple[int, int], ...] = tuple(
+    (column_index_from_string("K") + i * 6, column_index_from_string("K") + i * 6 + 2)
+    for i in range(len(_SCENARIO_ROWS))
+)
+_SCENARIO_COLS: Tuple[Tuple[str, str, str], ...] = tuple(
+    tuple(get_column_letter(ci) for ci in range(start_idx, end_idx + 1))
+    for start_idx, end_idx in _SCENARIO_COL_INDICES
+)
 
-def _range_has_no_empty_cells_cols(sheet, start_col: str, end_col: str, start_row: int, end_row: int) -> bool:
-    c1 = column_index_from_string(start_col)
-    c2 = column_index_from_string(end_col)
-    for row in range(start_row, end_row + 1):
-        for c in range(c1, c2 + 1):
-            addr = f"{get_column_letter(c)}{row}"
-            v = sheet[addr].value
-            if v is None or str(v).strip() == "":
-                return False
-    return True
 
+def _first_incomplete_scenario(wb: Workbook, results_sheet, topic: str) -> Optional[int]:
+    """Return the first defined scenario with an empty cell in the topic's rows.
+
+    Args:
+        wb: Workbook to check
+        results_sheet: Results sheet returned by _get_filled_results_sheet
+        topic: Key into the layout's entry of _RESULT_ROWS
 
-def _scenario_cols(scenario_index_zero_based: int) -> Tuple[str, str]:
-    start_idx = column_index_from_string("K") + scenario_index_zero_based * 6
-    return get_column_letter(start_idx), get_column_letter(start_idx + 2)
+    Returns:
+        Index of the first incomplete scenario, or None if all are complete
+    """
+    row_ranges = _RESULT_ROWS[_results_layout(wb, results_sheet)][topic]
+    block = _results_block(wb, results_sheet)
+    for i in _defined_scenarios(wb):
+        min_col, max_col = _SCENARIO_COL_INDICES[i]
+        if not _rows_have_no_empty_cells(block, row_ranges, min_col, max_col):
+            return i
+    return None
 
 
 def check_scenarios_business_planning_filled_three_years(wb: Workbook) -> Tuple[bool, str, str]:
@@ -1128,32 +1219,10 @@ def check_scenarios_business_planning_filled_three_years(wb: Workbook) -> Tuple[
     if not ok:
         return False, outcome_str, details_str
 
-    mapper = SheetNameMapper(wb)
-    szenarien_sheet = mapper.get_sheet("Szenarien")
-
-    # Check if Zweigniederlassungs version
-    is_zweigniederlassung = _is_zweigniederlassungs_version(wb)
-    is_avo = _is_avo_finma_sheet(results_sheet.title)
-
-    for i, type_addr in enumerate(_scenario_type_cells()):
-        if (szenarien_sheet[type_addr].value or "") == "":
-            continue
-
-        start_col, end_col = _scenario_cols(i)
-
-        if is_zweigniederlassung:
-            # Zweigniederlassungs version: K10-M20 and K23 to M30
-            ok_1 = _range_has_no_empty_cells_cols(results_sheet, start_col, end_col, 10, 20)
-            ok_2 = _range_has_no_empty_cells_cols(results_sheet, start_col, end_col, 23, 30)
-        elif is_avo:
-            ok_1 = _range_has_no_empty_cells_cols(results_sheet, start_col, end_col, 11, 21)
-            ok_2 = _range_has_no_empty_cells_cols(results_sheet, start_col, end_col, 24, 35)
-        else:
-            ok_1 = _range_has_no_empty_cells_cols(results_sheet, start_col, end_col, 11, 23)
-            ok_2 = _range_has_no_empty_cells_cols(results_sheet, start_col, end_col, 26, 38)
-
-        if not (ok_1 and ok_2):
-            return False, "Prüfen", f"Geschäftsplanung für Szenarien ist nicht vollständig ausgefüllt. Szenario {i+1} (Spalten {start_col}-{end_col}) hat fehlende Werte."
+    i = _first_incomplete_scenario(wb, results_sheet, "business_planning")
+    if i is not None:
+        start_col, _, end_col = _SCENARIO_COLS[i]
+        return False, "Prüfen", f"Geschäftsplanung für Szenarien ist nicht vollständig ausgefüllt. Szenario {i+1} (Spalten {start_col}-{end_col}) hat fehlende Werte."
 
     return True, "OK", "Geschäftsplanung für alle Szenarien ist vollständig für drei Jahre ausgefüllt"
 
@@ -1167,24 +1236,10 @@ def check_scenarios_sst_filled_three_years(wb: Workbook) -> Tuple[bool, str, str
     if not ok:
         return False, outcome_str, details_str
 
-    mapper = SheetNameMapper(wb)
-    szenarien_sheet = mapper.get_sheet("Szenarien")
-
-    is_avo = _is_avo_finma_sheet(results_sheet.title)
-
-    for i, type_addr in enumerate(_scenario_type_cells()):
-        if (szenarien_sheet[type_addr].value or "") == "":
-            continue
-
-        start_col, end_col = _scenario_cols(i)
-
-        if is_avo:
-            ok_range = _range_has_no_empty_cells_cols(results_sheet, start_col, end_col, 42, 45)
-        else:
-            ok_range = _range_has_no_empty_cells_cols(results_sheet, start_col, end_col, 44, 47)
-
-        if not ok_range:
-            return False, "Prüfen", f"SST-Daten für Szenarien sind nicht vollständig ausgefüllt. Szenario {i+1} (Spalten {start_col}-{end_col}) hat fehlende Werte."
+    i = _first_incomplete_scenario(wb, results_sheet, "sst")
+    if i is not None:
+        start_col, _, end_col = _SCENARIO_COLS[i]
+        return False, "Prüfen", f"SST-Daten für Szenarien sind nicht vollständig ausgefüllt. Szenario {i+1} (Spalten {start_col}-{end_col}) hat fehlende Werte."
 
     return True, "OK", "SST-Daten für alle Szenarien sind vollständig für drei Jahre ausgefüllt"
 
@@ -1194,29 +1249,10 @@ def check_scenarios_tied_assets_filled_three_years(wb: Workbook) -> Tuple[bool,
     if not ok:
         return False, outcome_str, details_str
 
-    mapper = SheetNameMapper(wb)
-    szenarien_sheet = mapper.get_sheet("Szenarien")
-
-    # Check if Zweigniederlassungs version
-    is_zweigniederlassung = _is_zweigniederlassungs_version(wb)
-    is_avo = _is_avo_finma_sheet(results_sheet.title)
-
-    for i, type_addr in enumerate(_scenario_type_cells()):
-        if (szenarien_sheet[type_addr].value or "") == "":
-            continue
-
-        start_col, end_col = _scenario_cols(i)
-
-        if is_zweigniederlassung:
-            # Zweigniederlassungs version: K38 to M40
-            ok_range = _range_has_no_empty_cells_cols(results_sheet, start_col, end_col, 38, 40)
-        elif is_avo:
-            ok_range = _range_has_no_empty_cells_cols(results_sheet, start_col, end_col, 49, 51)
-        else:
-            ok_range = _range_has_no_empty_cells_cols(results_sheet, start_col, end_col, 51, 54)
-
-        if not ok_range:
-            return False, "Prüfen", f"Gebundenes Vermögen für Szenarien ist nicht vollständig ausgefüllt. Szenario {i+1} (Spalten {start_col}-{end_col}) hat fehlende Werte."
+    i = _first_incomplete_scenario(wb, results_sheet, "tied_assets")
+    if i is not None:
+        start_col, _, end_col = _SCENARIO_COLS[i]
+        return False, "Prüfen", f"Gebundenes Vermögen für Szenarien ist nicht vollständig ausgefüllt. Szenario {i+1} (Spalten {start_col}-{end_col}) hat fehlende Werte."
 
     return True, "OK", "Gebundenes Vermögen für alle Szenarien ist vollständig für drei Jahre ausgefüllt"
 
@@ -1226,27 +1262,10 @@ def check_scenarios_provisions_filled_three_years(wb: Workbook) -> Tuple[bool, s
     if not ok:
         return False, outcome_str, details_str
 
-    mapper = SheetNameMapper(wb)
-    szenarien_sheet = mapper.get_sheet("Szenarien")
-
-    # Check if Zweigniederlassungs version
-    is_zweigniederlassung = _is_zweigniederlassungs_version(wb)
-    is_avo = _is_avo_finma_sheet(results_sheet.title)
-    
-    if is_zweigniederlassung:
-        row = 60
-    else:
-        row = 71 if is_avo else 73
-
-    for i, type_addr in enumerate(_scenario_type_cells()):
-        if (szenarien_sheet[type_addr].value or "") == "":
-            continue
-
-        start_col, end_col = _scenario_cols(i)
-        ok_range = _range_has_no_empty_cells_cols(results_sheet, start_col, end_col, row, row)
-
-        if not ok_range:
-            return False, "Prüfen", f"Rückstellungen für Szenarien sind nicht vollständig ausgefüllt. Szenario {i+1} (Spalten {start_col}-{end_col}) hat fehlende Werte."
+    i = _first_incomplete_scenario(wb, results_sheet, "provisions")
+    if i is not None:
+        start_col, _, end_col = _SCENARIO_COLS[i]
+        return False, "Prüfen", f"Rückstellungen für Szenarien sind nicht vollständig ausgefüllt. Szenario {i+1} (Spalten {start_col}-{end_col}) hat fehlende Werte."
 
     return True, "OK", "Rückstellungen für alle Szenarien sind vollständig für drei Jahre ausgefüllt"
 
@@ -1256,48 +1275,14 @@ def check_scenarios_other_perspective_filled_three_years(wb: Workbook) -> Tuple[
     if not ok:
         return False, outcome_str, details_str
 
-    mapper = SheetNameMapper(wb)
-    szenarien_sheet = mapper.get_sheet("Szenarien")
-
-    # Check if Zweigniederlassungs version
-    is_zweigniederlassung = _is_zweigniederlassungs_version(wb)
-    is_avo = _is_avo_finma_sheet(results_sheet.title)
-
-    if is_zweigniederlassung:
-        # Zweigniederlassungs version: K63 to M63, K66 to M66, K69 to M69
-        row_ranges = [(63, 63), (66, 66), (69, 69)]
-        shift = 0
-    else:
-        shift = 0 if is_avo else 2
-        row_ranges = [
-            (74, 74),
-            (77, 77),
-            (82, 84),
-            (86, 86),
-            (89, 89),
-            (93, 93),
-            (97, 97),
-        ]
-
-    for i, type_addr in enumerate(_scenario_type_cells()):
-        if (szenarien_sheet[type_addr].value or "") == "":
-            continue
-
-        c_e, c_g = _scenario_cols(i)
-        c_f = get_column_letter(column_index_from_string(c_e) + 1)
-
-        for r1, r2 in row_ranges:
-            for row in range(r1 + shift, r2 + shift + 1):
-                e_val = results_sheet[f"{c_e}{row}"].value
-                f_val = results_sheet[f"{c_f}{row}"].value
-                g_val = results_sheet[f"{c_g}{row}"].value
-
-                e_filled = e_val is not None and str(e_val).strip() != ""
-                f_filled = f_val is not None and str(f_val).strip() != ""
-                g_filled = g_val is not None and str(g_val).strip() != ""
+    row_ranges = _RESULT_ROWS[_results_layout(wb, results_sheet)]["other_perspective"]
+    block = _results_block(wb, results_sheet)
 
-                if e_filled and not (f_filled and g_filled):
-                    return False, "Prüfen", f"Andere Perspektive für Szenarien ist nur teilweise ausgefüllt. Szenario {i+1}, Zeile {row}: Spalte {c_e} ist ausgefüllt, aber {c_f} und/oder {c_g} fehlen."
+    for i in _defined_scenarios(wb):
+        row = _first_partial_row(block, row_ranges, _SCENARIO_COL_INDICES[i][0])
+        if row is not None:
+            c_e, c_f, c_g = _SCENARIO_COLS[i]
+            return False, "Prüfen", f"Andere Perspektive für Szenarien ist nur teilweise ausgefüllt. Szenario {i+1}, Zeile {row}: Spalte {c_e} ist ausgefüllt, aber {c_f} und/oder {c_g} fehlen."
 
     return True, "OK", "Andere Perspektive für alle Szenarien ist konsistent ausgefüllt (alle Zeilen sind entweder komplett für drei Jahre ausgefüllt oder komplett leer)"
 
@@ -1313,27 +1298,10 @@ def check_scenarios_liquidity_filled_three_years(wb: Workbook) -> Tuple[bool, st
     if not ok:
         return False, outcome_str, details_str
 
-    mapper = SheetNameMapper(wb)
-    szenarien_sheet = mapper.get_sheet("Szenarien")
-
-    # Check if Zweigniederlassungs version
-    is_zweigniederlassung = _is_zweigniederlassungs_version(wb)
-    is_avo = _is_avo_finma_sheet(results_sheet.title)
-
-    if is_zweigniederlassung:
-        row = 66
-    else:
-        row = 86 if is_avo else 88
-
-    for i, type_addr in enumerate(_scenario_type_cells()):
-        if (szenarien_sheet[type_addr].value or "") == "":
-            continue
-
-        start_col, end_col = _scenario_cols(i)
-        ok_range = _range_has_no_empty_cells_cols(results_sheet, start_col, end_col, row, row)
-
-        if not ok_range:
-            return False, "Nein", f"Liquidität für Szenarien ist nicht vollständig ausgefüllt. Szenario {i+1} (Spalten {start_col}-{end_col}) hat fehlende Werte."
+    i = _first_incomplete_scenario(wb, results_sheet, "liquidity")
+    if i is not None:
+        start_col, _, end_col = _SCENARIO_COLS[i]
+        return False, "Nein", f"Liquidität für Szenarien ist nicht vollständig ausgefüllt. Szenario {i+1} (Spalten {start_col}-{end_col}) hat fehlende Werte."
 
     return True, "Ja", "Liquidität für alle Szenarien ist vollständig für drei Jahre ausgefüllt"
 
@@ -1345,15 +1313,14 @@ def check_count_longterm_risks(wb: Workbook) -> Tuple[bool, str, str]:
     if _is_zweigniederlassungs_version(wb):
         return False, "Kein Rating", "Kein Rating da es sich um eine Zweigniederlassung handelt"
     
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Qual. & langfr. Risiken")
+    block = _sheet_block(wb, "Qual. & langfr. Risiken")
     
-    if sheet is None:
+    if block is None:
         return True, "0", "Anzahl identifizierter qualitativer und langfristiger Risiken: 0 (Tabellenblatt 'Qual. & langfr. Risiken' nicht gefunden)"
 
     count = 0
-    for row in range(25, 40):
-        if (sheet[f"C{row}"].value or "") != "":
+    for value in block.column("C", 25, 39):
+        if (value or "") != "":
             count += 1
 
     count_str = str(count)
@@ -1364,13 +1331,12 @@ def check_treatment_of_qual_risks(wb: Workbook) -> Tuple[bool, str, str]:
     if _is_zweigniederlassungs_version(wb):
         return False, "Kein Rating", "Kein Rating da es sich um eine Zweigniederlassung handelt"
     
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Qual. & langfr. Risiken")
+    block = _sheet_block(wb, "Qual. & langfr. Risiken")
     
-    if sheet is None:
+    if block is None:
         return False, "", "Das Tabellenblatt 'Qual. & langfr. Risiken' wurde in der Arbeitsmappe nicht gefunden"
 
-    value = str(sheet["E4"].value or "")
+    value = str(block.value("E", 4) or "")
     
     # Extract the value and return it (e.g., "(1)", "(2)", "(3)", "(4)", "(5)")
     # Return True if we found something, False if empty
@@ -1382,24 +1348,28 @@ def check_treatment_of_qual_risks(wb: Workbook) -> Tuple[bool, str, str]:
 #### Schlussfolgerungen, Dokument.
 
 def check_orsa_dokumentation_sufficient(wb: Workbook) -> Tuple[bool, str, str]:
-    mapper = SheetNameMapper(wb)
-    sheet = mapper.get_sheet("Schlussfolgerungen, Dokument.")
+    sheet = _get_sheet(wb, "Schlussfolgerungen, Dokument.")
     
     if sheet is None:
         return False, "Prüfen", "Das Tabellenblatt 'Schlussfolgerungen, Dokument.' wurde in der Arbeitsmappe nicht gefunden"
 
-    values = [str(sheet[f"C{row}"].value or "") for row in range(24, 31)]
+    # Rating prefix of each criterion, "" for empty and non-text cells
+    prefixes = [
+        value[:3] if type(value) is str else ""
+        for (value,) in _read_range(sheet, 24, 30, 3, 3)
+    ]
+    count_2 = prefixes.count("(2)")
 
-    if any(v.startswith("(3)") for v in values):
+    if "(3)" in prefixes:
         result_str = "ungenügend"
         desc = "ORSA-Dokumentation ist ungenügend: Mindestens ein Kriterium ist mit '(3)  Im ORSA nicht spezifisch behandelt' bewertet"
-    elif all(v.startswith("(2)") for v in values):
+    elif count_2 == len(prefixes):
         result_str = "genügend"
         desc = "ORSA-Dokumentation ist genügend: Alle ausgefüllten Kriterien sind mit '(2) Durchführung und Ergebnisse spezifisch dokumentiert' bewertet"
-    elif any(v.startswith("(2)") for v in values):
+    elif count_2:
         result_str = "mangelhaft"
         desc = "ORSA-Dokumentation ist mangelhaft: Nur teilweise mit '(2) Durchführung und Ergebnisse spezifisch dokumentiert' bewertet"
-    elif all(v.startswith("(1)") for v in values):
+    elif prefixes.count("(1)") == len(prefixes):
         result_str = "mangelhaft"
         desc = "ORSA-Dokumentation ist mangelhaft: Nur mit '(1) Behandelt aber nicht spezifisch dokumentiert' bewertet"
     else:
@@ -1414,7 +1384,7 @@ def check_orsa_dokumentation_sufficient(wb: Workbook) -> Tuple[bool, str, str]:
 
 
 
-REGISTERED_CHECKS: list[Tuple[str, CheckFunction]] = [
+REGISTERED_CHECKS: Tuple[Tuple[str, CheckFunction], ...] = (
     ("check_responsible_person", check_responsible_person),
     ("check_data_recency_geschaeftsplanung", check_data_recency_geschaeftsplanung),
     ("check_data_recency_risikoidentifikation",check_data_recency_risikoidentifikation,),
@@ -1464,16 +1434,17 @@ REGISTERED_CHECKS: list[Tuple[str, CheckFunction]] = [
     ("check_count_number_other_measures_other_effect", check_count_number_other_measures_other_effect),
     ("check_liquidity_filled_three_years", check_liquidity_filled_three_years),
     ("check_scenarios_liquidity_filled_three_years", check_scenarios_liquidity_filled_three_years),
-]
+)
 
 
-def get_all_checks() -> list[Tuple[str, CheckFunction]]:
+def get_all_checks() -> Tuple[Tuple[str, CheckFunction], ...]:
     """Get all registered check functions.
 
     Returns:
-        List of tuples (check_name, check_function)
+        Tuple of tuples (check_name, check_function). The registry is
+        immutable, so it is returned without copying.
     """
-    return REGISTERED_CHECKS.copy()
+    return REGISTERED_CHECKS
 
 
 def run_check(
@@ -1481,6 +1452,11 @@ def run_check(
 ) -> Tuple[bool, str, str]:
     """Execute a single check with error handling.
 
+    Checks only read cached cell values, so the workbook should be loaded with
+    ExcelReader(data_only=True, read_only=True) as the processor does; a fully
+    loaded workbook gives the same results but parses styles and creates cell
+    objects the checks never use.
+
     Args:
         check_name: Name of the check
         check_function: Check function to execute
@@ -1492,5 +1468,29 @@ def run_check(
     try:
         return check_function(workbook)
     except Exception as e:
-        logger.error(f"Check '{check_name}' failed with error: {e}")
-        return False, "zu prüfen", f"Check failed with error: {str(e)}"
+        logger.error("Check '%s' failed with error: %s", check_name, e)
+        return False, STR_ZU_PRUEFEN, f"Check failed with error: {str(e)}"
+
+
+def run_all_checks(workbook: Workbook) -> List[Tuple[str, bool, str, str]]:
+    """Execute all registered checks on a workbook.
+
+    Each check keeps its own error handling via run_check(), so one failing
+    check does not affect the others. Values several checks derive from the
+    workbook are shared for the duration of this call only.
+
+    Args:
+        workbook: Workbook to check
+
+    Returns:
+        List of (check_name, outcome, outcome_str, description) tuples in
+        registration order
+    """
+    token = _run_memo.set({})
+    try:
+        return [
+            (check_name, *run_check(check_name, check_function, workbook))
+            for check_name, check_function in REGISTERED_CHECKS
+        ]
+    finally:
+        _run_memo.reset(token)
@@ -4,7 +4,8 @@ This module handles translation between German (reference), English, and French
 sheet names in ORSA Excel files.
 """
 
-from typing import Dict, Optional, List
+from functools import cached_property
+from typing import Dict, FrozenSet, Optional, List
 from openpyxl.workbook.workbook import Workbook
 import logging
 
@@ -74,7 +75,16 @@ class SheetNameMapper:
         """
         self.workbook = workbook
         self.detected_language = self._detect_language()
-        logger.info(f"Detected workbook language: {self.detected_language}")
+        logger.debug("Detected workbook language: %s", self.detected_language)
+
+    @cached_property
+    def sheetnames_set(self) -> FrozenSet[str]:
+        """Sheet names of the workbook as a set, built once per mapper.
+
+        Returns:
+            Frozen set of all sheet names in the workbook
+        """
+        return frozenset(self.workbook.sheetnames)
 
     def _detect_language(self) -> str:
         """Detect the language of the workbook by checking sheet names.
@@ -82,7 +92,7 @@ class SheetNameMapper:
         Returns:
             'DE' for German, 'EN' for English, 'FR' for French
         """
-        sheet_names = set(self.workbook.sheetnames)
+        sheet_names = self.sheetnames_set
         
         # Count matches for each language
         de_matches = 0
@@ -116,7 +126,7 @@ class SheetNameMapper:
         """
         if self.detected_language == "DE":
             # For German, return the reference name itself
-            return german_reference if german_reference in self.workbook.sheetnames else None
+            return german_reference if german_reference in self.sheetnames_set else None
         
         # For other languages, look up in mapping
         if german_reference not in SHEET_NAME_MAPPING:
@@ -126,7 +136,7 @@ class SheetNameMapper:
         translated_name = SHEET_NAME_MAPPING[german_reference][self.detected_language]
         
         # Verify the translated name exists in the workbook
-        if translated_name not in self.workbook.sheetnames:
+        if translated_name not in self.sheetnames_set:
             logger.warning(
                 f"Translated sheet name '{translated_name}' ({self.detected_language}) "
                 f"not found in workbook"
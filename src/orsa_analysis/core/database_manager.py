@@ -12,10 +12,17 @@ import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# SQL Server accepts at most 2100 parameters and 1000 rows per INSERT statement
+MSSQL_MAX_PARAMETERS = 2100
+MSSQL_MAX_INSERT_ROWS = 1000
 
-@dataclass
+
+@dataclass(slots=True)
 class CheckResult:
-    """Check result that can be stored in the database."""
+    """Check result that can be stored in the database.
+
+    Slotted because one instance is created per file and check.
+    """
 
     institute_id: str
     file_name: str
@@ -96,8 +103,9 @@ class DatabaseManager:
             conn_str = f"mssql+pyodbc://{self.server}/{self.database}?driver=SQL+Server"
             logger.info(f"Using pyodbc driver with Windows authentication for {self.server}/{self.database}")
             logger.debug(f"Connection string: {conn_str}")
-            # pyodbc driver supports use_setinputsizes parameter
-            return create_engine(conn_str, use_setinputsizes=False)
+            # pyodbc driver supports use_setinputsizes parameter; fast_executemany
+            # sends the to_sql inserts as one parameter array instead of row by row
+            return create_engine(conn_str, use_setinputsizes=False, fast_executemany=True)
     
     def execute_query(self, query: str) -> pd.DataFrame:
         """Execute SQL query and return DataFrame."""
@@ -146,12 +154,32 @@ class DatabaseManager:
                 con=conn,
                 schema=self.schema,
                 if_exists="append",
-                index=False
+                index=False,
+                **self._insert_options(len(df.columns)),
             )
         
         logger.info(f"Wrote {len(results)} results to {self.schema}.{self.table_name}")
         return len(results)
     
+    def _insert_options(self, column_count: int) -> Dict[str, Any]:
+        """Get DataFrame.to_sql options for the active driver.
+        
+        pyodbc already batches executemany via fast_executemany. pymssql sends
+        one statement per row, so rows are grouped into multi-row INSERTs sized
+        to stay within SQL Server's parameter and row limits.
+        
+        Args:
+            column_count: Number of columns per inserted row
+            
+        Returns:
+            Keyword arguments for DataFrame.to_sql
+        """
+        if self.engine.dialect.driver != "pymssql":
+            return {}
+        
+        chunksize = min(MSSQL_MAX_INSERT_ROWS, (MSSQL_MAX_PARAMETERS - 1) // column_count)
+        return {"method": "multi", "chunksize": chunksize}
+    
     def get_existing_versions(self) -> List[Dict[str, Any]]:
         """Get existing file versions from database."""
         try:
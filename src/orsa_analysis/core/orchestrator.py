@@ -9,11 +9,12 @@ This module coordinates the entire workflow:
 
 import logging
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict, Any
+from typing import Iterable, Iterator, List, Tuple, Optional, Dict, Any
 from datetime import datetime
 
 from orsa_analysis.core.processor import DocumentProcessor
 from orsa_analysis.core.database_manager import DatabaseManager, CheckResult
+from orsa_analysis.core.versioning import FileVersion
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,7 @@ class ORSAPipeline:
     Args:
         db_manager: DatabaseManager instance for result storage
         force_reprocess: If True, reprocess all files regardless of cache status
+        workers: Number of processes running the quality checks
     
     Example:
         >>> db_manager = DatabaseManager(connection_string="mssql+pyodbc://...")
@@ -38,14 +40,24 @@ class ORSAPipeline:
         >>> pipeline.generate_summary()
     """
     
-    def __init__(self, db_manager: DatabaseManager, force_reprocess: bool = False):
+    def __init__(
+        self, db_manager: DatabaseManager, force_reprocess: bool = False, workers: int = 1
+    ):
         """Initialize the pipeline with database connection and processing options.
         
         Args:
             db_manager: DatabaseManager for storing results
             force_reprocess: Whether to reprocess already-seen files
+            workers: Number of worker processes running the quality checks.
+                With 1 (default) every document is checked in this process.
+        
+        Raises:
+            ValueError: If workers is smaller than 1
         """
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
         self.db_manager = db_manager
+        self.workers = workers
         self.processor = DocumentProcessor(db_manager, force_reprocess=force_reprocess)
         self.processing_stats = {
             "files_processed": 0,
@@ -58,11 +70,11 @@ class ORSAPipeline:
             "end_time": None,
         }
         logger.info(
-            f"Initialized ORSA pipeline (force_reprocess={force_reprocess})"
+            f"Initialized ORSA pipeline (force_reprocess={force_reprocess}, workers={workers})"
         )
     
     def process_documents(
-        self, documents: List[Tuple]
+        self, documents: Iterable[Tuple]
     ) -> Dict[str, Any]:
         """Process a list of documents through the quality control pipeline.
         
@@ -75,8 +87,9 @@ class ORSAPipeline:
         6. Returns processing statistics
         
         Args:
-            documents: List of 5-tuples with format:
-                (document_name, file_path, geschaeft_nr, finma_id, berichtsjahr)
+            documents: List or iterator of 5-tuples with format:
+                (document_name, file_path, geschaeft_nr, finma_id, berichtsjahr).
+                Iterators are consumed lazily, one document at a time.
         
         Returns:
             Dictionary containing:
@@ -101,62 +114,18 @@ class ORSAPipeline:
         self.processing_stats["start_time"] = datetime.now()
         institutes_seen = set()
         
-        logger.info(f"Starting pipeline processing for {len(documents)} documents")
+        logger.info(f"Starting pipeline processing with {self.workers} worker(s)")
         
-        for doc_name, file_path, geschaeft_nr, finma_id, berichtsjahr in documents:
-            try:
-                # Validate file exists
-                if not file_path.exists():
-                    logger.error(f"File not found: {file_path}")
-                    self.processing_stats["files_failed"] += 1
-                    continue
-                
-                # Use FinmaID as institute_id
-                institute_id = finma_id
-                institutes_seen.add(institute_id)
-                
-                logger.info(
-                    f"Processing {doc_name} for institute {institute_id}"
-                )
-                
-                # Check if file should be processed (caching logic)
-                should_process, reason = self.processor.should_process_file(
-                    institute_id, file_path
-                )
-                
-                if not should_process:
-                    logger.info(
-                        f"Skipping {doc_name}: {reason}"
-                    )
-                    self.processing_stats["files_skipped"] += 1
-                    continue
-                
-                # Process file through quality checks
-                version_info, check_results = self.processor.process_file(
-                    institute_id, file_path, geschaeft_nr, berichtsjahr
-                )
-                
-                # Update statistics
-                self.processing_stats["files_processed"] += 1
-                self.processing_stats["checks_run"] += len(check_results)
-                
-                # Count passed/failed checks
-                for check_result in check_results:
-                    if check_result.outcome_bool:
-                        self.processing_stats["checks_passed"] += 1
-                    else:
-                        self.processing_stats["checks_failed"] += 1
-                
-                logger.info(
-                    f"Completed {doc_name}: version {version_info.version_number}, "
-                    f"{len(check_results)} checks run"
-                )
-                
-            except Exception as e:
-                logger.error(
-                    f"Failed to process {doc_name}: {str(e)}", exc_info=True
-                )
-                self.processing_stats["files_failed"] += 1
+        # With more than one worker the checks run in a process pool while
+        # hashing, versioning and database writes stay in this process
+        jobs = self._iter_jobs(documents, institutes_seen)
+        for doc_name, status, version_info, check_results in self.processor.process_batch(
+            jobs, self.workers
+        ):
+            if status == "processed":
+                self._update_stats(doc_name, version_info, check_results)
+            else:
+                self.processing_stats[f"files_{status}"] += 1
         
         self.processing_stats["end_time"] = datetime.now()
         self.processing_stats["institutes"] = sorted(list(institutes_seen))
@@ -191,16 +160,69 @@ class ORSAPipeline:
         
         return summary
     
+    def _iter_jobs(
+        self, documents: Iterable[Tuple], institutes_seen: set
+    ) -> Iterator[Tuple[str, str, Path, Optional[str], Optional[int]]]:
+        """Turn pipeline documents into jobs for DocumentProcessor.process_batch().
+        
+        Missing files are counted as failed and not passed on.
+        
+        Args:
+            documents: Iterable of (document_name, file_path, geschaeft_nr, finma_id, berichtsjahr)
+            institutes_seen: Set collecting the institute IDs of all documents
+        
+        Yields:
+            Tuples (document_name, institute_id, file_path, geschaeft_nr, berichtsjahr)
+        """
+        for doc_name, file_path, geschaeft_nr, finma_id, berichtsjahr in documents:
+            # Validate file exists
+            if not file_path.exists():
+                logger.error(f"File not found: {file_path}")
+                self.processing_stats["files_failed"] += 1
+                continue
+            
+            # Use FinmaID as institute_id
+            institute_id = finma_id
+            institutes_seen.add(institute_id)
+            
+            logger.info(f"Processing {doc_name} for institute {institute_id}")
+            yield doc_name, institute_id, file_path, geschaeft_nr, berichtsjahr
+    
+    def _update_stats(
+        self, doc_name: str, version_info: FileVersion, check_results: List[CheckResult]
+    ) -> None:
+        """Add the results of one processed file to the pipeline statistics.
+        
+        Args:
+            doc_name: Name of the processed document
+            version_info: FileVersion assigned to the document
+            check_results: Check results stored for the document
+        """
+        self.processing_stats["files_processed"] += 1
+        self.processing_stats["checks_run"] += len(check_results)
+        
+        # Count passed/failed checks
+        for check_result in check_results:
+            if check_result.outcome_bool:
+                self.processing_stats["checks_passed"] += 1
+            else:
+                self.processing_stats["checks_failed"] += 1
+        
+        logger.info(
+            f"Completed {doc_name}: version {version_info.version_number}, "
+            f"{len(check_results)} checks run"
+        )
+    
     def process_from_sourcer(self, sourcer: Any) -> Dict[str, Any]:
         """Process documents directly from an ORSADocumentSourcer.
         
         This is a convenience method that:
-        1. Calls sourcer.load() to download documents
-        2. Processes the downloaded files
+        1. Streams documents from sourcer.iter_documents()
+        2. Processes each file as soon as it has been downloaded
         3. Returns processing statistics
         
         Args:
-            sourcer: ORSADocumentSourcer instance with load() method
+            sourcer: ORSADocumentSourcer instance with iter_documents() method
         
         Returns:
             Processing summary dictionary (see process_documents)
@@ -210,10 +232,8 @@ class ORSAPipeline:
             >>> sourcer = ORSADocumentSourcer()
             >>> results = pipeline.process_from_sourcer(sourcer)
         """
-        logger.info("Loading documents from ORSADocumentSourcer")
-        documents = sourcer.load()
-        logger.info(f"Retrieved {len(documents)} documents from sourcer")
-        return self.process_documents(documents)
+        logger.info("Streaming documents from ORSADocumentSourcer")
+        return self.process_documents(sourcer.iter_documents())
     
     def generate_summary(self) -> Dict[str, Any]:
         """Generate a comprehensive summary of pipeline execution.
@@ -1,18 +1,53 @@
 """Main processing orchestration with caching."""
 
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 import logging
 
 from orsa_analysis.core.reader import ExcelReader
 from orsa_analysis.core.versioning import VersionManager, FileVersion
 from orsa_analysis.core.database_manager import CheckResult, DatabaseManager
-from orsa_analysis.checks.rules import get_all_checks, run_check
+from orsa_analysis.checks.rules import REGISTERED_CHECKS, run_all_checks
 
 logger = logging.getLogger(__name__)
 
 
+def _run_checks(
+    file_path: Path, reader: Optional[ExcelReader] = None
+) -> List[Tuple[str, bool, str, str]]:
+    """Load a workbook and run all registered checks on it.
+
+    Kept at module level so it can be submitted to a process pool; only the
+    plain outcome tuples are sent back to the parent process.
+
+    Args:
+        file_path: Path to the Excel file
+        reader: ExcelReader to use, a read-only reader is created if omitted
+
+    Returns:
+        List of (check_name, outcome, outcome_str, description) tuples
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ValueError: If file is not valid Excel format
+    """
+    if reader is None:
+        reader = ExcelReader(data_only=True, read_only=True)
+
+    workbook = None
+    try:
+        workbook = reader.load_file(file_path)
+
+        logger.info(f"Running {len(REGISTERED_CHECKS)} checks on {file_path.name}")
+        return run_all_checks(workbook)
+    finally:
+        if workbook:
+            reader.close_workbook(workbook)
+
+
 class DocumentProcessor:
     """Orchestrates the processing of Excel documents with caching."""
 
@@ -31,6 +66,10 @@ class DocumentProcessor:
         self.version_manager = VersionManager()
         self.db_manager = db_manager
         self.force_reprocess = force_reprocess
+        self._n_files = 0
+        self._n_checks = 0
+        self._n_pass = 0
+        self._institutes: set[str] = set()
         self._load_existing_versions()
 
     def _load_existing_versions(self) -> None:
@@ -81,63 +120,233 @@ class DocumentProcessor:
         logger.info(f"Processing file: {file_path.name} for institute: {institute_id}")
 
         version_info = self.version_manager.get_version(institute_id, file_path)
-        workbook = None
+        outcomes = _run_checks(file_path, self.reader)
+        results = self._record_results(
+            institute_id, version_info, outcomes, geschaeft_nr, berichtsjahr
+        )
+        return version_info, results
+
+    def _record_outcomes(
+        self,
+        institute_id: str,
+        file_path: Path,
+        outcomes: List[Tuple[str, bool, str, str]],
+        geschaeft_nr: Optional[str] = None,
+        berichtsjahr: Optional[int] = None,
+    ) -> Tuple[FileVersion, List[CheckResult]]:
+        """Version a file and store check outcomes returned by a worker process.
+
+        Counterpart of process_file() for the pool path of process_batch().
+
+        Args:
+            institute_id: Identifier for the institute
+            file_path: Path to the Excel file
+            outcomes: List of (check_name, outcome, outcome_str, description) tuples
+            geschaeft_nr: Optional business case number (Geschäftsnummer)
+            berichtsjahr: Optional reporting year (Berichtsjahr)
+
+        Returns:
+            Tuple of (FileVersion, List of CheckResults)
+        """
+        version_info = self.version_manager.get_version(institute_id, file_path)
+        results = self._record_results(
+            institute_id, version_info, outcomes, geschaeft_nr, berichtsjahr
+        )
+        return version_info, results
+
+    def _record_results(
+        self,
+        institute_id: str,
+        version_info: FileVersion,
+        outcomes: List[Tuple[str, bool, str, str]],
+        geschaeft_nr: Optional[str] = None,
+        berichtsjahr: Optional[int] = None,
+    ) -> List[CheckResult]:
+        """Turn raw check outcomes into CheckResults and write them to the database.
+
+        Args:
+            institute_id: Identifier for the institute
+            version_info: Version metadata of the processed file
+            outcomes: List of (check_name, outcome, outcome_str, description) tuples
+            geschaeft_nr: Optional business case number (Geschäftsnummer)
+            berichtsjahr: Optional reporting year (Berichtsjahr)
+
+        Returns:
+            List of CheckResults
+        """
+        processed_at = datetime.now()
         results = []
+        n_pass = 0
+
+        for check_name, outcome, outcome_str, description in outcomes:
+            result = CheckResult(
+                institute_id=institute_id,
+                file_name=version_info.file_name,
+                file_hash=version_info.file_hash,
+                version_number=version_info.version_number,
+                check_name=check_name,
+                check_description=description,
+                outcome_bool=outcome,
+                outcome_str=outcome_str,
+                processed_at=processed_at,
+                geschaeft_nr=geschaeft_nr,
+                berichtsjahr=berichtsjahr,
+            )
+            results.append(result)
+
+            # Passing checks are only interesting with --verbose; the per-file
+            # summary below stays at INFO. Lazy arguments keep the dropped
+            # DEBUG lines from being formatted at all.
+            if outcome:
+                n_pass += 1
+                logger.debug("Check '%s': PASS - %s", check_name, description)
+            else:
+                logger.warning("Check '%s': FAIL - %s", check_name, description)
+
+        self._n_files += 1
+        self._n_checks += len(results)
+        self._n_pass += n_pass
+        self._institutes.add(institute_id)
 
-        try:
-            workbook = self.reader.load_file(file_path)
-            processed_at = datetime.now()
+        logger.info(
+            f"Completed processing {version_info.file_name}: "
+            f"{n_pass}/{len(results)} checks passed"
+        )
 
-            all_checks = get_all_checks()
-            logger.info(f"Running {len(all_checks)} checks on {file_path.name}")
+        # Write results to database
+        self.db_manager.write_results(results)
 
-            for check_name, check_function in all_checks:
-                outcome, outcome_str, description = run_check(
-                    check_name, check_function, workbook
-                )
+        return results
 
-                result = CheckResult(
-                    institute_id=institute_id,
-                    file_name=version_info.file_name,
-                    file_hash=version_info.file_hash,
-                    version_number=version_info.version_number,
-                    check_name=check_name,
-                    check_description=description,
-                    outcome_bool=outcome,
-                    outcome_str=outcome_str,
-                    processed_at=processed_at,
-                    geschaeft_nr=geschaeft_nr,
-                    berichtsjahr=berichtsjahr,
-                )
-                results.append(result)
+    def process_batch(
+        self,
+        jobs: Iterable[Tuple[str, str, Path, Optional[str], Optional[int]]],
+        max_workers: int = 1,
+    ) -> Iterator[Tuple[str, str, Optional[FileVersion], List[CheckResult]]]:
+        """Process a batch of files, optionally checking them in a process pool.
+
+        With more than one worker, workbooks are parsed and checked in a process
+        pool; versioning and database writes stay in this process so they
+        remain serialized. Pooled files are recorded in submission order as
+        soon as they are done, so version numbers are assigned exactly as in
+        the sequential path.
 
-                log_level = logging.INFO if outcome else logging.WARNING
-                logger.log(
-                    log_level,
-                    f"Check '{check_name}': {'PASS' if outcome else 'FAIL'} - {description}",
+        Args:
+            jobs: List or iterator of tuples
+                (file_name, institute_id, file_path, geschaeft_nr, berichtsjahr).
+                Each file is submitted as soon as it is yielded, so a streaming
+                source overlaps with the checks already running.
+            max_workers: Number of worker processes. With 1 (default) all
+                files are processed sequentially in this process.
+
+        Yields:
+            Tuples (file_name, status, FileVersion, List[CheckResult]) where
+            status is "processed", "skipped" or "failed"; skipped and failed
+            files have no FileVersion and no results
+        """
+        if max_workers == 1:
+            for file_name, institute_id, file_path, geschaeft_nr, berichtsjahr in jobs:
+                try:
+                    should_process, reason = self.should_process_file(institute_id, file_path)
+                    if should_process:
+                        version_info, results = self.process_file(
+                            institute_id, file_path, geschaeft_nr, berichtsjahr
+                        )
+                except Exception as e:
+                    logger.error(f"Failed to process {file_name}: {e}", exc_info=True)
+                    yield file_name, "failed", None, []
+                    continue
+
+                if not should_process:
+                    logger.info(f"Skipping {file_name}: {reason}")
+                    yield file_name, "skipped", None, []
+                    continue
+
+                yield file_name, "processed", version_info, results
+            return
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque()
+            for file_name, institute_id, file_path, geschaeft_nr, berichtsjahr in jobs:
+                # Record finished files while the source is still yielding,
+                # keeping submission order for the version numbers
+                while pending and pending[0][-1].done():
+                    yield self._collect_pooled(*pending.popleft())
+
+                try:
+                    should_process, reason = self.should_process_file(institute_id, file_path)
+                except Exception as e:
+                    logger.error(f"Failed to process {file_name}: {e}", exc_info=True)
+                    yield file_name, "failed", None, []
+                    continue
+
+                if not should_process:
+                    logger.info(f"Skipping {file_name}: {reason}")
+                    yield file_name, "skipped", None, []
+                    continue
+
+                future = executor.submit(_run_checks, file_path)
+                pending.append(
+                    (file_name, institute_id, file_path, geschaeft_nr, berichtsjahr, future)
                 )
 
-            logger.info(
-                f"Completed processing {file_path.name}: "
-                f"{sum(1 for r in results if r.outcome_bool)}/{len(results)} checks passed"
-            )
+            while pending:
+                yield self._collect_pooled(*pending.popleft())
 
-            # Write results to database
-            self.db_manager.write_results(results)
+    def _collect_pooled(
+        self,
+        file_name: str,
+        institute_id: str,
+        file_path: Path,
+        geschaeft_nr: Optional[str],
+        berichtsjahr: Optional[int],
+        future: Future,
+    ) -> Tuple[str, str, Optional[FileVersion], List[CheckResult]]:
+        """Wait for a pooled file and record its outcomes.
 
-        finally:
-            if workbook:
-                self.reader.close_workbook(workbook)
+        Args:
+            file_name: Name of the file
+            institute_id: Identifier for the institute
+            file_path: Path to the Excel file
+            geschaeft_nr: Optional business case number (Geschäftsnummer)
+            berichtsjahr: Optional reporting year (Berichtsjahr)
+            future: Future of the _run_checks() call for the file
 
-        return version_info, results
+        Returns:
+            Tuple (file_name, status, FileVersion, List[CheckResult]) as yielded
+            by process_batch()
+        """
+        try:
+            outcomes = future.result()
+
+            # The same file may occur twice within one batch
+            should_process, reason = self.should_process_file(institute_id, file_path)
+            if should_process:
+                version_info, results = self._record_outcomes(
+                    institute_id, file_path, outcomes, geschaeft_nr, berichtsjahr
+                )
+        except Exception as e:
+            logger.error(f"Failed to process {file_name}: {e}", exc_info=True)
+            return file_name, "failed", None, []
+
+        if not should_process:
+            logger.info(f"Skipping {file_name}: {reason}")
+            return file_name, "skipped", None, []
+
+        return file_name, "processed", version_info, results
 
     def process_documents(
-        self, documents: List[Tuple[str, Path]]
+        self, documents: Iterable[Tuple[str, Path]], max_workers: int = 1
     ) -> List[Tuple[str, FileVersion, List[CheckResult]]]:
         """Process multiple documents from ORSADocumentSourcer.
 
+        The institute ID is derived from the file name; see process_batch()
+        for how the files are checked.
+
         Args:
-            documents: List of tuples (file_name, file_path) from ORSADocumentSourcer.load()
+            documents: List or iterator of tuples (file_name, file_path)
+            max_workers: Number of worker processes. With 1 (default) all
+                files are processed sequentially in this process.
 
         Returns:
             List of tuples (institute_id, FileVersion, List[CheckResult])
@@ -146,25 +355,18 @@ class DocumentProcessor:
         processed_count = 0
         skipped_count = 0
 
-        logger.info(f"Starting batch processing of {len(documents)} documents")
+        logger.info(f"Starting batch processing with {max_workers} worker process(es)")
 
-        for file_name, file_path in documents:
-            institute_id = self._extract_institute_id(file_name)
-
-            should_process, reason = self.should_process_file(institute_id, file_path)
-
-            if not should_process:
-                logger.info(f"Skipping {file_name}: {reason}")
-                skipped_count += 1
-                continue
-
-            try:
-                version_info, results = self.process_file(institute_id, file_path)
-                all_results.append((institute_id, version_info, results))
+        jobs = (
+            (file_name, self._extract_institute_id(file_name), file_path, None, None)
+            for file_name, file_path in documents
+        )
+        for _, status, version_info, results in self.process_batch(jobs, max_workers):
+            if status == "processed":
+                all_results.append((version_info.institute_id, version_info, results))
                 processed_count += 1
-            except Exception as e:
-                logger.error(f"Failed to process {file_name}: {e}")
-                continue
+            elif status == "skipped":
+                skipped_count += 1
 
         logger.info(
             f"Batch processing complete: {processed_count} processed, {skipped_count} skipped"
@@ -192,30 +394,18 @@ class DocumentProcessor:
     def get_processing_summary(self) -> dict:
         """Get summary of processing statistics.
 
+        The counters are updated as results are recorded, so building the
+        summary does not traverse any results.
+
         Returns:
-            Dictionary with processing statistics
+            Dictionary with processing statistics for the files processed
+            by this instance
         """
-        # Note: This method requires stored results from the database
-        # For now, return basic statistics from version manager
-        all_versions = self.version_manager._version_cache
-        if not all_versions:
-            return {
-                "total_files": 0,
-                "total_checks": 0,
-                "checks_passed": 0,
-                "checks_failed": 0,
-                "institutes": [],
-            }
-
-        institutes = set(all_versions.keys())
-
-        total_files = sum(len(hashes) for hashes in all_versions.values())
-
         return {
-            "total_files": total_files,
-            "total_checks": 0,
-            "checks_passed": 0,
-            "checks_failed": 0,
-            "institutes": sorted(list(institutes)),
-            "pass_rate": "N/A",
+            "total_files": self._n_files,
+            "total_checks": self._n_checks,
+            "checks_passed": self._n_pass,
+            "checks_failed": self._n_checks - self._n_pass,
+            "institutes": sorted(self._institutes),
+            "pass_rate": self._n_pass / max(1, self._n_checks),
         }
@@ -13,15 +13,20 @@ logger = logging.getLogger(__name__)
 class ExcelReader:
     """Handles reading Excel files using openpyxl."""
 
-    def __init__(self, data_only: bool = True, read_only: bool = False):
+    def __init__(
+        self, data_only: bool = True, read_only: bool = False, keep_links: bool = False
+    ):
         """Initialize the Excel reader.
 
         Args:
             data_only: If True, cell values are read instead of formulas
             read_only: If True, file is opened in read-only mode for better performance
+            keep_links: If True, cached data of external workbook links is parsed.
+                Only needed when the workbook is saved again.
         """
         self.data_only = data_only
         self.read_only = read_only
+        self.keep_links = keep_links
 
     def load_file(self, file_path: Path) -> Optional[Workbook]:
         """Load an Excel file and return a Workbook object.
@@ -47,6 +52,7 @@ class ExcelReader:
                 filename=str(file_path),
                 data_only=self.data_only,
                 read_only=self.read_only,
+                keep_links=self.keep_links,
             )
             logger.info(f"Successfully loaded workbook: {file_path.name}")
             return workbook
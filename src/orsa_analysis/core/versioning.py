@@ -2,12 +2,15 @@
 
 import hashlib
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Tuple
 from dataclasses import dataclass
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Read size for the pre-3.11 hashing fallback
+HASH_CHUNK_SIZE = 1024 * 1024
+
 
 @dataclass
 class FileVersion:
@@ -25,10 +28,15 @@ class VersionManager:
     def __init__(self):
         """Initialize the version manager with empty state."""
         self._version_cache: Dict[str, Dict[str, int]] = {}
+        self._hash_cache: Dict[Path, Tuple[Tuple[int, int], str]] = {}
 
     def compute_file_hash(self, file_path: Path) -> str:
         """Compute SHA-256 hash of a file.
 
+        Hashes are remembered per path together with the file's size and
+        modification time; as long as both are unchanged the cached hash is
+        returned and the file is not read again.
+
         Args:
             file_path: Path to the file
 
@@ -38,16 +46,28 @@ class VersionManager:
         Raises:
             FileNotFoundError: If the file does not exist
         """
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
+
+        fingerprint = (stat.st_size, stat.st_mtime_ns)
+        cached = self._hash_cache.get(file_path)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
 
-        sha256_hash = hashlib.sha256()
         try:
             with open(file_path, "rb") as f:
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
-            file_hash = sha256_hash.hexdigest()
-            logger.debug(f"Computed hash for {file_path.name}: {file_hash}")
+                if hasattr(hashlib, "file_digest"):
+                    # Python 3.11+: hashed inside OpenSSL without per-chunk bytecode
+                    file_hash = hashlib.file_digest(f, "sha256").hexdigest()
+                else:
+                    sha256_hash = hashlib.sha256()
+                    for byte_block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                        sha256_hash.update(byte_block)
+                    file_hash = sha256_hash.hexdigest()
+            self._hash_cache[file_path] = (fingerprint, file_hash)
+            logger.debug("Computed hash for %s: %s", file_path.name, file_hash)
             return file_hash
         except Exception as e:
             logger.error(f"Failed to compute hash for {file_path}: {e}")
@@ -113,7 +113,7 @@ class ExcelTemplateManager:
             return value
 
     def write_cell_value(
-        self, sheet_name: str, cell_address: str, value: Any
+        self, sheet_name: str, cell_address: str, value: Any, is_check_outcome: bool = False
     ) -> bool:
         """Write a value to a specific cell in the output workbook.
         
@@ -124,6 +124,8 @@ class ExcelTemplateManager:
             sheet_name: Name of the worksheet
             cell_address: Cell address (e.g., "A1", "B5")
             value: Value to write (numeric strings are auto-converted)
+            is_check_outcome: Marks the outcome cell of a check result; does
+                not change how the value is written
 
         Returns:
             True if successful, False otherwise
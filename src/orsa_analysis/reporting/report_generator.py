@@ -1,8 +1,11 @@
 """Main report generation orchestrator."""
 
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from openpyxl import load_workbook
 
 from orsa_analysis.core.database_manager import DatabaseManager
 from orsa_analysis.reporting.excel_template_manager import ExcelTemplateManager
@@ -13,6 +16,107 @@ from orsa_analysis.reporting.sharepoint_uploader import SharePointUploader
 logger = logging.getLogger(__name__)
 
 
+class _CellWriteRecorder:
+    """Stand-in for ExcelTemplateManager that records cell writes.
+
+    Used to prepare reports that are rendered in a worker process: the
+    database lookups run here, only the resulting writes are sent along.
+    """
+
+    def __init__(self, sheetnames: List[str]):
+        self.sheetnames = set(sheetnames)
+        self.writes: List[Tuple[str, str, Any, bool]] = []
+
+    def write_cell_value(
+        self, sheet_name: str, cell_address: str, value: Any, is_check_outcome: bool = False
+    ) -> bool:
+        if sheet_name not in self.sheetnames:
+            logger.error(f"Sheet not found: {sheet_name}")
+            return False
+        self.writes.append((sheet_name, cell_address, value, is_check_outcome))
+        return True
+
+
+def _render_report(
+    template_manager: ExcelTemplateManager,
+    source_file_path: Path,
+    output_path: Path,
+    fill: Callable[[], int],
+) -> Optional[int]:
+    """Create the output workbook, fill it and save it.
+
+    Used by both the sequential and the pooled report generation, so a
+    report fails the same way in either.
+
+    Args:
+        template_manager: Template manager writing the report
+        source_file_path: Path to the source ORSA file
+        output_path: Path where to save the report
+        fill: Writes the report cells and returns the number of check
+            results applied
+
+    Returns:
+        Number of check results applied, or None if the output workbook
+        could not be created
+
+    Raises:
+        Exception: If the report cannot be saved
+    """
+    # Create standalone output workbook from template
+    try:
+        template_manager.create_output_workbook(source_file_path)
+    except Exception as e:
+        logger.error(f"Failed to create output workbook: {e}")
+        return None
+
+    try:
+        applied_count = fill()
+
+        # Save output file
+        try:
+            template_manager.save_workbook(output_path)
+            logger.info(f"Report saved successfully: {output_path}")
+        except Exception as e:
+            logger.error(f"Failed to save report to {output_path}: {e}")
+            raise
+    finally:
+        template_manager.close()
+
+    return applied_count
+
+
+def _render_recorded_report(
+    template_path: Path,
+    source_file_path: Path,
+    output_path: Path,
+    writes: List[Tuple[str, str, Any, bool]],
+) -> Optional[int]:
+    """Render a report from recorded cell writes.
+
+    Kept at module level so it can be submitted to a process pool.
+
+    Args:
+        template_path: Path to template Excel file
+        source_file_path: Path to the source ORSA file
+        output_path: Path where to save the report
+        writes: List of (sheet_name, cell_address, value, is_check_outcome) tuples
+
+    Returns:
+        Number of check results applied, or None if the output workbook
+        could not be created
+    """
+    template_manager = ExcelTemplateManager(template_path)
+
+    def fill() -> int:
+        applied_count = 0
+        for sheet_name, cell_address, value, is_check_outcome in writes:
+            if template_manager.write_cell_value(sheet_name, cell_address, value) and is_check_outcome:
+                applied_count += 1
+        return applied_count
+
+    return _render_report(template_manager, source_file_path, output_path, fill)
+
+
 class ReportGenerator:
     """Generate Excel reports from check results stored in database."""
     
@@ -22,7 +126,8 @@ class ReportGenerator:
                  output_dir: Path,
                  check_mapper: Optional[CheckToCellMapper] = None,
                  enable_upload: bool = False,
-                 download_links: Optional[Dict[str, str]] = None):
+                 download_links: Optional[Dict[str, str]] = None,
+                 workers: int = 1):
         """Initialize report generator.
         
         Args:
@@ -32,13 +137,22 @@ class ReportGenerator:
             check_mapper: Optional custom check mapper. If None, uses default.
             enable_upload: If True, upload reports to SharePoint (default: False)
             download_links: Optional mapping of institute_id -> download_link for uploads
+            workers: Number of processes writing reports in generate_all_reports()
+                (default: 1, all reports are written in this process)
+        
+        Raises:
+            ValueError: If workers is smaller than 1
         """
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
         self.db_manager = db_manager
+        self.template_path = Path(template_path)
         self.template_manager = ExcelTemplateManager(template_path)
         self.output_dir = Path(output_dir)
         self.check_mapper = check_mapper if check_mapper is not None else CheckToCellMapper()
         self.enable_upload = enable_upload
         self.download_links = download_links or {}
+        self.workers = workers
         self.uploader = None
         
         # Initialize SharePoint uploader if upload is enabled
@@ -76,6 +190,44 @@ class ReportGenerator:
         """
         logger.info(f"Generating report for institute: {institute_id}")
         
+        report_inputs = self._get_report_inputs(institute_id, source_file_path)
+        if report_inputs is None:
+            return None
+        check_results, output_path = report_inputs
+        
+        def fill() -> int:
+            # Apply check results to output
+            applied_count = self._apply_check_results(check_results)
+            
+            # Apply institut metadata to output (FinmaID, FinmaObjektName, MitarbeiterName)
+            self._apply_institut_metadata(institute_id)
+            return applied_count
+        
+        applied_count = _render_report(
+            self.template_manager, source_file_path, output_path, fill
+        )
+        if applied_count is None:
+            return None
+        logger.info(f"Applied {applied_count} check results to report")
+        
+        logger.info(f"Report generated successfully: {output_path}")
+        
+        self._upload_if_enabled(institute_id, output_path)
+        
+        return output_path
+    
+    def _get_report_inputs(
+        self, institute_id: str, source_file_path: Optional[Path]
+    ) -> Optional[Tuple[List[Dict], Path]]:
+        """Fetch check results and determine the output path for a report.
+        
+        Args:
+            institute_id: Institute identifier (FinmaID)
+            source_file_path: Optional path to source ORSA file
+            
+        Returns:
+            Tuple of (check_results, output_path), or None if no report can be generated
+        """
         # Get check results from database
         check_results = self.db_manager.get_latest_results_for_institute(institute_id)
         if not check_results:
@@ -96,44 +248,49 @@ class ReportGenerator:
         if output_path.exists():
             logger.info(f"Report already exists locally, will overwrite: {output_path}")
         
-        # Create standalone output workbook from template
-        try:
-            self.template_manager.create_output_workbook(source_file_path)
-        except Exception as e:
-            logger.error(f"Failed to create output workbook: {e}")
-            return None
-        
-        # Apply check results to output
-        applied_count = self._apply_check_results(check_results)
-        logger.info(f"Applied {applied_count} check results to report")
-        
-        # Apply institut metadata to output (FinmaID, FinmaObjektName, MitarbeiterName)
-        self._apply_institut_metadata(institute_id)
-        
-        # Save output file
-        try:
-            self.template_manager.save_workbook(output_path)
-            logger.info(f"Report saved successfully: {output_path}")
-        except Exception as e:
-            logger.error(f"Failed to save report to {output_path}: {e}")
-            # Clean up before re-raising
-            self.template_manager.close()
-            raise
-        
-        # Clean up
-        self.template_manager.close()
-        
-        logger.info(f"Report generated successfully: {output_path}")
+        return check_results, output_path
+    
+    def _upload_if_enabled(self, institute_id: str, output_path: Path) -> None:
+        """Upload a generated report to SharePoint if uploads are enabled.
         
-        # Upload to SharePoint if enabled
+        Args:
+            institute_id: Institute identifier
+            output_path: Path to generated report file
+        """
         if self.enable_upload and self.uploader:
             try:
                 self._upload_report(institute_id, output_path)
             except Exception as e:
                 logger.error(f"Failed to upload report for {institute_id}: {e}", exc_info=True)
                 # Don't fail the entire report generation if upload fails
+    
+    def _prepare_report(
+        self, institute_id: str, source_file_path: Optional[Path], sheetnames: List[str]
+    ) -> Optional[Tuple[Path, List[Tuple[str, str, Any, bool]]]]:
+        """Collect all cell writes of a report without touching the template.
         
-        return output_path
+        Args:
+            institute_id: Institute identifier (FinmaID)
+            source_file_path: Optional path to source ORSA file
+            sheetnames: Sheet names of the template
+            
+        Returns:
+            Tuple of (output_path, writes) with writes as
+            (sheet_name, cell_address, value, is_check_outcome) tuples,
+            or None if no report can be generated
+        """
+        logger.info(f"Generating report for institute: {institute_id}")
+        
+        report_inputs = self._get_report_inputs(institute_id, source_file_path)
+        if report_inputs is None:
+            return None
+        check_results, output_path = report_inputs
+        
+        recorder = _CellWriteRecorder(sheetnames)
+        self._apply_check_results(check_results, recorder)
+        self._apply_institut_metadata(institute_id, recorder)
+        
+        return output_path, recorder.writes
     
     def generate_all_reports(self, 
                            source_files: Optional[Dict[str, Path]] = None) -> List[Path]:
@@ -154,6 +311,13 @@ class ReportGenerator:
         generated_reports = []
         failed_reports = []
         
+        if self.workers > 1:
+            self._generate_reports_in_pool(
+                institutes, source_files, generated_reports, failed_reports
+            )
+            self._log_report_summary(institutes, generated_reports, failed_reports)
+            return generated_reports
+        
         for institute_id in institutes:
             logger.info(f"Processing {institute_id}...")
             
@@ -173,23 +337,59 @@ class ReportGenerator:
                     generated_reports.append(report_path)
                     logger.info(f"✓ Report generated successfully for {institute_id}")
                 else:
-                    failed_reports.append({
-                        'institute_id': institute_id,
-                        'error': 'Report generation returned None'
-                    })
-                    logger.warning(f"✗ Report generation returned None for {institute_id}")
+                    self._record_failure(failed_reports, institute_id)
             except Exception as e:
-                failed_reports.append({
-                    'institute_id': institute_id,
-                    'error': str(e),
-                    'error_type': type(e).__name__
-                })
-                logger.error(
-                    f"✗ Report generation failed for {institute_id}: {type(e).__name__}: {e}",
-                    exc_info=True
-                )
+                self._record_failure(failed_reports, institute_id, e)
+        
+        self._log_report_summary(institutes, generated_reports, failed_reports)
+        
+        return generated_reports
+    
+    def _record_failure(
+        self,
+        failed_reports: List[Dict[str, str]],
+        institute_id: str,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """Log a failed report and append its failure record.
+        
+        Args:
+            failed_reports: List failure records are appended to
+            institute_id: Institute identifier
+            error: Exception raised while generating the report, or None if
+                report generation returned None
+        """
+        if error is None:
+            failed_reports.append({
+                'institute_id': institute_id,
+                'error': 'Report generation returned None'
+            })
+            logger.warning(f"✗ Report generation returned None for {institute_id}")
+            return
+        
+        failed_reports.append({
+            'institute_id': institute_id,
+            'error': str(error),
+            'error_type': type(error).__name__
+        })
+        logger.error(
+            f"✗ Report generation failed for {institute_id}: {type(error).__name__}: {error}",
+            exc_info=True
+        )
+    
+    def _log_report_summary(
+        self,
+        institutes: List[str],
+        generated_reports: List[Path],
+        failed_reports: List[Dict[str, str]],
+    ) -> None:
+        """Log the outcome of generate_all_reports().
         
-        # Log comprehensive summary
+        Args:
+            institutes: Institute IDs reports were generated for
+            generated_reports: Paths of the saved reports
+            failed_reports: Failure records of the reports that failed
+        """
         logger.info("=" * 60)
         logger.info(f"Report generation complete:")
         logger.info(f"  Total institutes: {len(institutes)}")
@@ -203,8 +403,69 @@ class ReportGenerator:
                     f"  - {failed['institute_id']}: {failed.get('error_type', 'Error')}: {failed['error']}"
                 )
         logger.info("=" * 60)
+    
+    def _generate_reports_in_pool(
+        self,
+        institutes: List[str],
+        source_files: Optional[Dict[str, Path]],
+        generated_reports: List[Path],
+        failed_reports: List[Dict[str, str]],
+    ) -> None:
+        """Write reports in a process pool.
+        
+        Database lookups and uploads stay in this process; the workers only
+        fill and save the template, which is the CPU-bound part.
         
-        return generated_reports
+        Args:
+            institutes: Institute IDs to generate reports for
+            source_files: Optional mapping of institute_id -> source file path
+            generated_reports: List the paths of saved reports are appended to
+            failed_reports: List failure records are appended to
+        """
+        template = load_workbook(self.template_path, read_only=True)
+        sheetnames = template.sheetnames
+        template.close()
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = []
+            for institute_id in institutes:
+                logger.info(f"Processing {institute_id}...")
+                
+                source_path = None
+                if source_files and institute_id in source_files:
+                    source_path = source_files[institute_id]
+                
+                try:
+                    prepared = self._prepare_report(institute_id, source_path, sheetnames)
+                    if prepared is None:
+                        self._record_failure(failed_reports, institute_id)
+                        continue
+                    
+                    output_path, writes = prepared
+                    future = executor.submit(
+                        _render_recorded_report,
+                        self.template_path,
+                        source_path,
+                        output_path,
+                        writes,
+                    )
+                    pending.append((institute_id, output_path, future))
+                except Exception as e:
+                    self._record_failure(failed_reports, institute_id, e)
+            
+            for institute_id, output_path, future in pending:
+                try:
+                    applied_count = future.result()
+                    if applied_count is None:
+                        self._record_failure(failed_reports, institute_id)
+                        continue
+                    logger.info(f"Applied {applied_count} check results to report")
+                    logger.info(f"Report generated successfully: {output_path}")
+                    self._upload_if_enabled(institute_id, output_path)
+                    generated_reports.append(output_path)
+                    logger.info(f"✓ Report generated successfully for {institute_id}")
+                except Exception as e:
+                    self._record_failure(failed_reports, institute_id, e)
     
     def get_institutes_with_results(self) -> List[str]:
         """Get list of institutes that have check results.
@@ -214,15 +475,18 @@ class ReportGenerator:
         """
         return self.db_manager.get_all_institutes_with_results()
     
-    def _apply_check_results(self, check_results: List[Dict]) -> int:
+    def _apply_check_results(self, check_results: List[Dict], target=None) -> int:
         """Apply check results to workbook cells.
         
         Args:
             check_results: List of check result dictionaries
+            target: Object receiving the cell writes, defaults to the template manager
             
         Returns:
             Number of check results successfully applied
         """
+        if target is None:
+            target = self.template_manager
         applied_count = 0
         
         for result in check_results:
@@ -247,10 +511,11 @@ class ReportGenerator:
                 )
                 
                 # Write outcome value to cell
-                success = self.template_manager.write_cell_value(
+                success = target.write_cell_value(
                     sheet_name,
                     cell_address,
-                    value
+                    value,
+                    is_check_outcome=True
                 )
                 
                 if success:
@@ -267,7 +532,7 @@ class ReportGenerator:
                     )
                     
                     if description:
-                        desc_success = self.template_manager.write_cell_value(
+                        desc_success = target.write_cell_value(
                             sheet_name,
                             description_cell,
                             description
@@ -284,7 +549,7 @@ class ReportGenerator:
         
         return applied_count
     
-    def _apply_institut_metadata(self, institute_id: str) -> bool:
+    def _apply_institut_metadata(self, institute_id: str, target=None) -> bool:
         """Apply institut metadata to workbook cells.
         
         Writes institute metadata to cells on the Daten sheet:
@@ -295,10 +560,13 @@ class ReportGenerator:
         
         Args:
             institute_id: Institute identifier (FinmaID)
+            target: Object receiving the cell writes, defaults to the template manager
             
         Returns:
             True if metadata was successfully applied, False otherwise
         """
+        if target is None:
+            target = self.template_manager
         try:
             # Fetch institut metadata from database
             institut_metadata = self.db_manager.get_institut_metadata_by_finmaid(institute_id)
@@ -324,7 +592,7 @@ class ReportGenerator:
                 value = institut_metadata.get(field_key)
                 
                 if value is not None:
-                    success = self.template_manager.write_cell_value(
+                    success = target.write_cell_value(
                         "Daten",
                         cell_address,
                         value
@@ -3,7 +3,7 @@
 import os
 import logging
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
 
 import pandas as pd
 import requests
@@ -33,6 +33,7 @@ class ORSADocumentSourcer:
         cred_file: Path to credentials file
         default_target_dir: Directory where documents are downloaded
         berichtsjahr: Reporting year to filter documents for
+        documents: Documents saved by the last download run
     """
 
     def __init__(self, cred_file: str = "credentials.env", berichtsjahr: int = 2026):
@@ -48,6 +49,7 @@ class ORSADocumentSourcer:
         self.default_target_dir = self.base_dir.parent.parent.parent / "data" / "orsa_response_files"
         self.berichtsjahr = berichtsjahr
         self.download_links = {}  # Maps institute_id (FinmaID) -> download_link
+        self.documents = []  # Documents saved by the last download run
         logger.info(f"Initialized ORSADocumentSourcer for Berichtsjahr {berichtsjahr}")
 
     def _load_query(self, name: str) -> str:
@@ -119,6 +121,26 @@ class ORSADocumentSourcer:
         Returns:
             List of tuples (document_name, file_path, geschaeft_nr, finma_id, berichtsjahr)
             
+        Note:
+            Requires DB_USER and DB_PASSWORD to be set in environment variables.
+            These are set by DatabaseManager when credentials_file is provided.
+        """
+        results = list(self.iter_downloads(document_df, target_dir))
+        logger.info(f"Successfully downloaded {len(results)}/{len(document_df)} documents")
+        return results
+
+    def iter_downloads(
+        self, document_df: pd.DataFrame, target_dir: Path = None
+    ) -> Iterator[Tuple[str, Path, str, str, int]]:
+        """Download documents from SharePoint links, yielding each one when it is saved.
+        
+        Args:
+            document_df: DataFrame with DokumentName, DokumentLink, GeschaeftNr, FinmaID, and Berichtsjahr columns
+            target_dir: Directory to save files (default: orsa_response_files/)
+            
+        Yields:
+            Tuples (document_name, file_path, geschaeft_nr, finma_id, berichtsjahr)
+            
         Note:
             Requires DB_USER and DB_PASSWORD to be set in environment variables.
             These are set by DatabaseManager when credentials_file is provided.
@@ -136,7 +158,7 @@ class ORSADocumentSourcer:
         if not username or not password:
             logger.warning("No credentials found in environment. Downloads may fail.")
         
-        results = []
+        self.documents = []
         for idx, row in document_df.iterrows():
             name = row["DokumentName"]
             link = row["DokumentLink"]
@@ -178,7 +200,6 @@ class ORSADocumentSourcer:
                 )
                 r.raise_for_status()
                 out.write_bytes(r.content)
-                results.append((name, out, geschaeft_nr, finma_id, berichtsjahr))
                 
                 # Store download link for this institute (for later upload)
                 if finma_id:
@@ -187,9 +208,11 @@ class ORSADocumentSourcer:
                 logger.info(f"  ✓ Saved to: {out}")
             except Exception as e:
                 logger.error(f"  ✗ Failed to download {name}: {e}")
-                
-        logger.info(f"Successfully downloaded {len(results)}/{len(document_df)} documents")
-        return results
+                continue
+
+            document = (name, out, geschaeft_nr, finma_id, berichtsjahr)
+            self.documents.append(document)
+            yield document
 
     def load(self, target_dir: Path = None) -> List[Tuple[str, Path, str, str, int]]:
         """Load all relevant ORSA documents.
@@ -210,6 +233,34 @@ class ORSADocumentSourcer:
         documents = self.download_documents(document_metadata_df, target_dir)
         logger.info(f"Document loading complete: {len(documents)} files ready")
         return documents
+
+    def iter_documents(self, target_dir: Path = None) -> Iterator[Tuple[str, Path, str, str, int]]:
+        """Stream all relevant ORSA documents as they are downloaded.
+        
+        Same as load(), but yields each document as soon as it is saved so
+        processing can start before the remaining downloads have finished.
+        
+        Args:
+            target_dir: Directory to save files (default: orsa_response_files/)
+            
+        Yields:
+            Tuples (document_name, file_path, geschaeft_nr, finma_id, berichtsjahr)
+        """
+        logger.info("Starting ORSA document streaming")
+        document_metadata_df = self.get_document_metadata()
+        yield from self.iter_downloads(document_metadata_df, target_dir)
+    
+    def get_documents(self) -> List[Tuple[str, Path, str, str, int]]:
+        """Get the documents saved by the last load() or iter_documents() run.
+        
+        Returns:
+            List of tuples (document_name, file_path, geschaeft_nr, finma_id, berichtsjahr)
+            
+        Note:
+            Use this instead of calling load() again once the documents have
+            been streamed, so they are not queried and downloaded twice.
+        """
+        return self.documents.copy()
     
     def get_download_links(self) -> Dict[str, str]:
         """Get the mapping of institute IDs to download links.
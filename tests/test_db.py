@@ -78,6 +78,88 @@ class TestCheckResult:
         assert result.outcome_bool is False
         assert result.outcome_str is None
 
+    def test_slots(self, sample_check_result):
+        """Test that CheckResult instances carry no per-instance __dict__."""
+        assert not hasattr(sample_check_result, "__dict__")
+        with pytest.raises(AttributeError):
+            sample_check_result.unknown_field = "value"
+
+
+class TestDatabaseManagerEngine:
+    """Test cases for engine creation in DatabaseManager."""
+
+    @patch('orsa_analysis.core.database_manager.create_engine')
+    def test_pyodbc_engine_uses_fast_executemany(self, mock_create_engine, monkeypatch):
+        """Test that the Windows-auth pyodbc engine batches inserts."""
+        monkeypatch.delenv("DB_USER", raising=False)
+        monkeypatch.delenv("DB_PASSWORD", raising=False)
+
+        DatabaseManager()
+
+        conn_str = mock_create_engine.call_args[0][0]
+        kwargs = mock_create_engine.call_args[1]
+        assert conn_str.startswith("mssql+pyodbc://")
+        assert kwargs["fast_executemany"] is True
+        assert kwargs["use_setinputsizes"] is False
+
+    @patch('orsa_analysis.core.database_manager.create_engine')
+    def test_pymssql_engine_without_pyodbc_options(self, mock_create_engine, monkeypatch):
+        """Test that pyodbc-only options are not passed to pymssql."""
+        monkeypatch.setenv("DB_USER", "user")
+        monkeypatch.setenv("DB_PASSWORD", "secret")
+
+        DatabaseManager()
+
+        conn_str = mock_create_engine.call_args[0][0]
+        assert conn_str.startswith("mssql+pymssql://")
+        assert "fast_executemany" not in mock_create_engine.call_args[1]
+
+
+class TestDatabaseManagerWriteResults:
+    """Test cases for writing check results."""
+
+    @patch('orsa_analysis.core.database_manager.create_engine')
+    def test_write_results_pymssql_uses_multirow_insert(
+        self, mock_create_engine, sample_check_result
+    ):
+        """Test that pymssql inserts are grouped into multi-row statements."""
+        mock_create_engine.return_value.dialect.driver = "pymssql"
+        db = DatabaseManager()
+
+        with patch.object(pd.DataFrame, 'to_sql') as mock_to_sql:
+            written = db.write_results([sample_check_result] * 3)
+
+        assert written == 3
+        kwargs = mock_to_sql.call_args[1]
+        assert kwargs["method"] == "multi"
+        # 11 columns per row must stay below the 2100 parameter limit
+        assert kwargs["chunksize"] * 11 < 2100
+
+    @patch('orsa_analysis.core.database_manager.create_engine')
+    def test_write_results_pyodbc_uses_executemany(
+        self, mock_create_engine, sample_check_result
+    ):
+        """Test that pyodbc keeps the default executemany insert."""
+        mock_create_engine.return_value.dialect.driver = "pyodbc"
+        db = DatabaseManager()
+
+        with patch.object(pd.DataFrame, 'to_sql') as mock_to_sql:
+            db.write_results([sample_check_result])
+
+        kwargs = mock_to_sql.call_args[1]
+        assert "method" not in kwargs
+        assert "chunksize" not in kwargs
+
+    @patch('orsa_analysis.core.database_manager.create_engine')
+    def test_write_results_empty(self, mock_create_engine):
+        """Test that an empty result list writes nothing."""
+        db = DatabaseManager()
+
+        with patch.object(pd.DataFrame, 'to_sql') as mock_to_sql:
+            assert db.write_results([]) == 0
+
+        mock_to_sql.assert_not_called()
+
 
 class TestDatabaseManagerInstitutMetadata:
     """Test cases for institut metadata functionality in DatabaseManager."""
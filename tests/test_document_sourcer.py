@@ -410,6 +410,59 @@ class TestORSADocumentSourcerLoad:
         assert results == []
 
 
+    @patch("requests.get")
+    @patch.object(ORSADocumentSourcer, "get_document_metadata")
+    def test_iter_documents_streams_downloads(
+        self, mock_get_metadata, mock_get, sample_metadata_df, tmp_path, monkeypatch
+    ):
+        """Test that iter_documents yields each document as it is downloaded."""
+        mock_response = Mock()
+        mock_response.content = b"file content"
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+        mock_get_metadata.return_value = sample_metadata_df
+        monkeypatch.setenv("DB_USER", "testuser")
+        monkeypatch.setenv("DB_PASSWORD", "testpass")
+
+        sourcer = ORSADocumentSourcer()
+        documents = sourcer.iter_documents(target_dir=tmp_path)
+
+        mock_get.assert_not_called()
+        first = next(documents)
+        assert mock_get.call_count == 1
+        assert first[1].exists()
+
+        remaining = list(documents)
+        assert len(remaining) == len(sample_metadata_df) - 1
+        mock_get_metadata.assert_called_once()
+
+    @patch("requests.get")
+    @patch.object(ORSADocumentSourcer, "get_document_metadata")
+    def test_get_documents_after_streaming(
+        self, mock_get_metadata, mock_get, sample_metadata_df, tmp_path, monkeypatch
+    ):
+        """Test that streamed documents can be reused without downloading again."""
+        mock_response = Mock()
+        mock_response.content = b"file content"
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+        mock_get_metadata.return_value = sample_metadata_df
+        monkeypatch.setenv("DB_USER", "testuser")
+        monkeypatch.setenv("DB_PASSWORD", "testpass")
+
+        sourcer = ORSADocumentSourcer()
+        streamed = list(sourcer.iter_documents(target_dir=tmp_path))
+        download_count = mock_get.call_count
+
+        assert sourcer.get_documents() == streamed
+        assert mock_get.call_count == download_count
+        mock_get_metadata.assert_called_once()
+
+        # A new run replaces the remembered documents
+        list(sourcer.iter_documents(target_dir=tmp_path))
+        assert sourcer.get_documents() == streamed
+
+
 class TestORSADocumentSourcerEnvironment:
     """Tests for environment configuration."""
 
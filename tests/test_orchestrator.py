@@ -3,7 +3,7 @@
 import pytest
 from pathlib import Path
 from openpyxl import Workbook
-from typing import List, Tuple, Dict, Any
+from typing import Iterator, List, Tuple, Dict, Any
 
 from orsa_analysis.core.orchestrator import ORSAPipeline
 from orsa_analysis.core.database_manager import CheckResult
@@ -49,6 +49,9 @@ class MockORSADocumentSourcer:
     def load(self) -> List[Tuple[str, Path, str, str, int]]:
         return self.documents
 
+    def iter_documents(self) -> Iterator[Tuple[str, Path, str, str, int]]:
+        yield from self.documents
+
 
 @pytest.fixture
 def sample_excel_file(tmp_path):
@@ -141,6 +144,43 @@ class TestORSAPipeline:
         assert "INST001" in summary["institutes"]
         assert "INST002" in summary["institutes"]
     
+    def test_initialization_invalid_workers(self, db_manager):
+        """Test that fewer than one worker is rejected."""
+        with pytest.raises(ValueError):
+            ORSAPipeline(db_manager, workers=0)
+
+    def test_process_documents_with_workers(
+        self, db_manager, sample_excel_file, sample_excel_file2
+    ):
+        """Test that a worker pool stores the same results as a sequential run."""
+        documents = [
+            ("INST001_report.xlsx", sample_excel_file, "GNR001", "INST001", 2026),
+            ("INST002_report.xlsx", sample_excel_file2, "GNR002", "INST002", 2026),
+        ]
+
+        summary = ORSAPipeline(db_manager, workers=2).process_documents(documents)
+        sequential_db = MockDatabaseManager()
+        expected = ORSAPipeline(sequential_db).process_documents(documents)
+
+        for key in ("files_processed", "total_checks", "checks_passed", "institutes"):
+            assert summary[key] == expected[key]
+        assert [
+            (r.institute_id, r.check_name, r.outcome_str, r.geschaeft_nr, r.berichtsjahr)
+            for r in db_manager.stored_results
+        ] == [
+            (r.institute_id, r.check_name, r.outcome_str, r.geschaeft_nr, r.berichtsjahr)
+            for r in sequential_db.stored_results
+        ]
+
+    def test_process_documents_with_workers_duplicate(self, db_manager, sample_excel_file):
+        """Test that a file occurring twice in one pooled batch is processed once."""
+        doc = ("INST001_report.xlsx", sample_excel_file, "GNR001", "INST001", 2026)
+
+        summary = ORSAPipeline(db_manager, workers=2).process_documents([doc, doc])
+
+        assert summary["files_processed"] == 1
+        assert summary["files_skipped"] == 1
+
     def test_process_duplicate_document_skipped(self, db_manager, sample_excel_file):
         """Test that duplicate documents are skipped."""
         # Create new pipeline for this test
@@ -162,7 +202,23 @@ class TestORSAPipeline:
         summary2 = pipeline2.process_documents(documents)
         assert summary2["files_processed"] == 0
         assert summary2["files_skipped"] == 1
-    
+
+    def test_cached_document_not_opened(self, db_manager, sample_excel_file, monkeypatch):
+        """Test that a cache hit never opens the workbook."""
+        documents = [("INST001_report.xlsx", sample_excel_file, "GNR001", "INST001", 2026)]
+        ORSAPipeline(db_manager).process_documents(documents)
+
+        pipeline = ORSAPipeline(db_manager)
+
+        def fail_load(file_path):
+            raise AssertionError("cached workbook should not be loaded")
+
+        monkeypatch.setattr(pipeline.processor.reader, "load_file", fail_load)
+
+        summary = pipeline.process_documents(documents)
+        assert summary["files_skipped"] == 1
+        assert summary["files_failed"] == 0
+
     def test_process_duplicate_with_force_reprocess(
         self, db_manager, sample_excel_file
     ):
@@ -206,6 +262,22 @@ class TestORSAPipeline:
         assert summary["files_processed"] == 1
         assert "INST001" in summary["institutes"]
     
+    def test_process_documents_from_iterator(
+        self, pipeline, sample_excel_file, sample_excel_file2
+    ):
+        """Test that documents can be streamed from a generator."""
+        documents = (
+            doc for doc in [
+                ("INST001_report.xlsx", sample_excel_file, "GNR001", "INST001", 2026),
+                ("INST002_report.xlsx", sample_excel_file2, "GNR002", "INST002", 2026),
+            ]
+        )
+
+        summary = pipeline.process_documents(documents)
+
+        assert summary["files_processed"] == 2
+        assert summary["institutes"] == ["INST001", "INST002"]
+
     def test_generate_summary(self, pipeline, sample_excel_file):
         """Test generating pipeline summary."""
         documents = [("INST001_report.xlsx", sample_excel_file, "GNR001", "INST001", 2026)]
@@ -1,10 +1,12 @@
 """Unit tests for the processor module."""
 
 import pytest
+from concurrent.futures import Future
 from pathlib import Path
 from openpyxl import Workbook
 from typing import List, Dict, Any
 
+from orsa_analysis.core import processor as processor_module
 from orsa_analysis.core.processor import DocumentProcessor
 from orsa_analysis.core.database_manager import CheckResult
 
@@ -64,6 +66,11 @@ class TestDocumentProcessor:
         assert processor.db_manager is not None
         assert processor.force_reprocess is False
 
+    def test_reader_is_read_only(self, processor):
+        """Test that workbooks are streamed in read-only, data-only mode."""
+        assert processor.reader.read_only is True
+        assert processor.reader.data_only is True
+
     def test_initialization_with_force(self, db_manager):
         """Test initialization with force reprocess."""
         processor = DocumentProcessor(db_manager, force_reprocess=True)
@@ -125,6 +132,24 @@ class TestDocumentProcessor:
         assert "check_responsible_person" in check_names
         assert "check_orsa_version" in check_names
 
+    def test_process_file_loads_workbook_once(
+        self, processor, sample_excel_file, monkeypatch
+    ):
+        """Test that all checks share a single loaded workbook."""
+        calls = []
+        original_load = processor.reader.load_file
+
+        def counting_load(file_path):
+            calls.append(file_path)
+            return original_load(file_path)
+
+        monkeypatch.setattr(processor.reader, "load_file", counting_load)
+
+        _, results = processor.process_file("INST001", sample_excel_file)
+
+        assert len(results) > 1
+        assert calls == [sample_excel_file]
+
     def test_process_file_not_found(self, processor):
         """Test processing a non-existent file."""
         with pytest.raises(FileNotFoundError):
@@ -164,6 +189,105 @@ class TestDocumentProcessor:
         results2 = processor.process_documents(documents)
         assert len(results2) == 0
 
+    def test_process_documents_parallel(self, processor, db_manager, tmp_path):
+        """Test that the process pool yields the same results as sequential runs."""
+        files = []
+        for i in range(3):
+            file_path = tmp_path / f"INST00{i}_report.xlsx"
+            wb = Workbook()
+            wb.active["A1"] = f"Data{i}"
+            wb.save(file_path)
+            files.append(file_path)
+
+        documents = [(f.name, f) for f in files]
+
+        parallel = processor.process_documents(documents, max_workers=2)
+        sequential = DocumentProcessor(MockDatabaseManager()).process_documents(
+            documents, max_workers=1
+        )
+
+        assert [r[0] for r in parallel] == ["INST000", "INST001", "INST002"]
+        for (_, v_par, res_par), (_, v_seq, res_seq) in zip(parallel, sequential):
+            assert v_par == v_seq
+            assert [
+                (r.check_name, r.outcome_bool, r.outcome_str) for r in res_par
+            ] == [(r.check_name, r.outcome_bool, r.outcome_str) for r in res_seq]
+        assert len(db_manager.stored_results) == sum(len(r[2]) for r in parallel)
+
+    def test_process_documents_from_iterator(self, processor, tmp_path):
+        """Test that documents can be streamed from a generator."""
+        files = []
+        for i in range(2):
+            file_path = tmp_path / f"INST00{i}_report.xlsx"
+            wb = Workbook()
+            wb.active["A1"] = f"Data{i}"
+            wb.save(file_path)
+            files.append(file_path)
+
+        results = processor.process_documents(
+            ((f.name, f) for f in files), max_workers=2
+        )
+
+        assert [r[0] for r in results] == ["INST000", "INST001"]
+
+    def test_process_documents_parallel_duplicate(self, processor, tmp_path):
+        """Test that a file occurring twice in one batch is processed once."""
+        file1 = tmp_path / "INST001_report.xlsx"
+
+        wb = Workbook()
+        wb.active["A1"] = "Data"
+        wb.save(file1)
+
+        results = processor.process_documents(
+            [(file1.name, file1), (file1.name, file1)], max_workers=2
+        )
+
+        assert len(results) == 1
+
+    def test_process_batch_records_while_streaming(
+        self, processor, db_manager, tmp_path, monkeypatch
+    ):
+        """Test that finished pooled files are recorded before the source is exhausted."""
+
+        class ImmediateExecutor:
+            """Executor running each submission right away."""
+
+            def __init__(self, max_workers):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
+
+            def submit(self, fn, *args):
+                future = Future()
+                future.set_result(fn(*args))
+                return future
+
+        monkeypatch.setattr(processor_module, "ProcessPoolExecutor", ImmediateExecutor)
+
+        files = []
+        for i in range(2):
+            file_path = tmp_path / f"INST00{i}_report.xlsx"
+            wb = Workbook()
+            wb.active["A1"] = f"Data{i}"
+            wb.save(file_path)
+            files.append(file_path)
+
+        recorded_before_end = []
+
+        def jobs():
+            for f in files:
+                yield f.name, f.stem, f, None, None
+            recorded_before_end.append(len(db_manager.stored_results))
+
+        statuses = [status for _, status, _, _ in processor.process_batch(jobs(), max_workers=2)]
+
+        assert statuses == ["processed", "processed"]
+        assert recorded_before_end[0] > 0
+
     def test_extract_institute_id_underscore(self, processor):
         """Test extracting institute ID with underscore separator."""
         institute_id = processor._extract_institute_id("INST001_report.xlsx")
@@ -196,15 +320,31 @@ class TestDocumentProcessor:
 
     def test_get_processing_summary_with_data(self, processor, sample_excel_file):
         """Test getting summary after processing files."""
-        processor.process_file("INST001", sample_excel_file)
+        _, results = processor.process_file("INST001", sample_excel_file)
 
         summary = processor.get_processing_summary()
 
-        assert summary["total_files"] >= 1
-        # Note: In the simplified version, total_checks is not tracked
-        assert summary["total_checks"] == 0
-        assert "INST001" in summary["institutes"]
-        assert summary["pass_rate"] == "N/A"
+        assert summary["total_files"] == 1
+        assert summary["total_checks"] == len(results)
+        assert summary["checks_passed"] == sum(r.outcome_bool for r in results)
+        assert (
+            summary["checks_passed"] + summary["checks_failed"]
+            == summary["total_checks"]
+        )
+        assert summary["institutes"] == ["INST001"]
+        assert summary["pass_rate"] == summary["checks_passed"] / len(results)
+
+    def test_get_processing_summary_skips_db_versions(self, db_manager):
+        """Test that versions loaded from the database are not counted."""
+        db_manager.existing_versions = [
+            {"institute_id": "INST009", "file_hash": "abc", "version_number": 1}
+        ]
+        processor = DocumentProcessor(db_manager)
+
+        summary = processor.get_processing_summary()
+
+        assert summary["total_files"] == 0
+        assert summary["institutes"] == []
 
     def test_versioning_increments(self, processor, tmp_path):
         """Test that version numbers increment for new files."""
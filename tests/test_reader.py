@@ -39,12 +39,14 @@ class TestExcelReader:
         reader = ExcelReader()
         assert reader.data_only is True
         assert reader.read_only is False
+        assert reader.keep_links is False
 
     def test_initialization_custom(self):
         """Test ExcelReader initialization with custom parameters."""
-        reader = ExcelReader(data_only=False, read_only=True)
+        reader = ExcelReader(data_only=False, read_only=True, keep_links=True)
         assert reader.data_only is False
         assert reader.read_only is True
+        assert reader.keep_links is True
 
     def test_load_file_success(self, sample_excel_file):
         """Test successful loading of an Excel file."""
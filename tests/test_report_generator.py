@@ -3,8 +3,13 @@
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from pathlib import Path
+from openpyxl import Workbook, load_workbook
 
-from orsa_analysis.reporting.report_generator import ReportGenerator
+from orsa_analysis.reporting.report_generator import (
+    ReportGenerator,
+    _render_recorded_report,
+    _render_report,
+)
 
 
 @pytest.fixture
@@ -289,3 +294,179 @@ class TestReportGeneratorErrorHandling:
             # Verify only 1 report was successfully generated
             assert len(result) == 1
             assert tmp_path / "report_INST001.xlsx" in result
+
+
+class TestReportGeneratorWorkers:
+    """Test cases for writing reports in a process pool."""
+
+    def test_initialization_invalid_workers(self, mock_db_manager, tmp_path):
+        """Test that fewer than one worker is rejected."""
+        template_path = tmp_path / "template.xlsx"
+        Workbook().save(template_path)
+
+        with pytest.raises(ValueError):
+            ReportGenerator(
+                db_manager=mock_db_manager,
+                template_path=template_path,
+                output_dir=tmp_path / "reports",
+                workers=0,
+            )
+
+    def test_generate_all_reports_with_workers(self, mock_db_manager, tmp_path):
+        """Test that pooled report generation writes the same cells as sequential runs."""
+        template_path = tmp_path / "template.xlsx"
+        template = Workbook()
+        template.active.title = "Daten"
+        template.save(template_path)
+
+        source_files = {}
+        for institute_id in ["INST001", "INST002"]:
+            source_files[institute_id] = tmp_path / f"{institute_id}.xlsx"
+            source_files[institute_id].touch()
+        mock_db_manager.get_all_institutes_with_results.return_value = list(source_files)
+        mock_db_manager.get_latest_results_for_institute.return_value = [
+            {
+                'check_name': 'check_orsa_dokumentation_sufficient',
+                'outcome_bool': 1,
+                'outcome_str': 'gut',
+                'check_description': 'Dokumentation vorhanden',
+            }
+        ]
+
+        def cell_values(reports):
+            values = []
+            for report in reports:
+                wb = load_workbook(report)
+                values.append([
+                    (cell.coordinate, cell.value)
+                    for row in wb["Daten"].iter_rows()
+                    for cell in row
+                    if cell.value is not None
+                ])
+            return values
+
+        sequential = ReportGenerator(
+            db_manager=mock_db_manager,
+            template_path=template_path,
+            output_dir=tmp_path / "sequential",
+        ).generate_all_reports(source_files=source_files)
+        pooled = ReportGenerator(
+            db_manager=mock_db_manager,
+            template_path=template_path,
+            output_dir=tmp_path / "pooled",
+            workers=2,
+        ).generate_all_reports(source_files=source_files)
+
+        assert [p.name for p in pooled] == [p.name for p in sequential]
+        assert cell_values(pooled) == cell_values(sequential)
+        assert ("C56", "gut") in cell_values(pooled)[0]
+
+    def test_prepare_report_marks_outcome_writes(self, mock_db_manager, tmp_path):
+        """Test that only the outcome cells of check results are marked as outcomes."""
+        template_path = tmp_path / "template.xlsx"
+        template = Workbook()
+        template.active.title = "Daten"
+        template.save(template_path)
+        source = tmp_path / "INST001.xlsx"
+        source.touch()
+        mock_db_manager.get_latest_results_for_institute.return_value = [
+            {
+                'check_name': 'check_orsa_dokumentation_sufficient',
+                'outcome_bool': 1,
+                'outcome_str': 'gut',
+                'check_description': 'Dokumentation vorhanden',
+            }
+        ]
+
+        generator = ReportGenerator(
+            db_manager=mock_db_manager,
+            template_path=template_path,
+            output_dir=tmp_path / "reports",
+        )
+        _, writes = generator._prepare_report("INST001", source, ["Daten"])
+
+        assert [(cell, outcome) for _, cell, _, outcome in writes] == [
+            ("C56", True),
+            ("D56", False),
+            ("C4", False),
+            ("C5", False),
+            ("C6", False),
+            ("C7", False),
+        ]
+
+    def test_generate_all_reports_with_workers_missing_source(
+        self, mock_db_manager, tmp_path
+    ):
+        """Test that institutes without a source file are skipped in the pool."""
+        template_path = tmp_path / "template.xlsx"
+        Workbook().save(template_path)
+        mock_db_manager.get_all_institutes_with_results.return_value = ["INST001"]
+
+        result = ReportGenerator(
+            db_manager=mock_db_manager,
+            template_path=template_path,
+            output_dir=tmp_path / "reports",
+            workers=2,
+        ).generate_all_reports(source_files={})
+
+        assert result == []
+
+
+class TestRenderReport:
+    """Test cases for the render step shared by sequential and pooled runs."""
+
+    def test_create_failure_returns_none(self, mock_template_manager, tmp_path):
+        """Test that a failing output workbook yields None instead of raising."""
+        mock_template_manager.create_output_workbook.side_effect = FileNotFoundError("gone")
+        fill = Mock(return_value=1)
+
+        result = _render_report(
+            mock_template_manager, tmp_path / "source.xlsx", tmp_path / "out.xlsx", fill
+        )
+
+        assert result is None
+        fill.assert_not_called()
+        mock_template_manager.save_workbook.assert_not_called()
+
+    def test_save_failure_raises_and_closes(self, mock_template_manager, tmp_path):
+        """Test that a failing save is re-raised after closing the workbook."""
+        mock_template_manager.save_workbook.side_effect = PermissionError("locked")
+
+        with pytest.raises(PermissionError):
+            _render_report(
+                mock_template_manager, tmp_path / "source.xlsx", tmp_path / "out.xlsx", lambda: 1
+            )
+
+        mock_template_manager.close.assert_called_once()
+
+    def test_recorded_report_counts_actual_writes(self, tmp_path):
+        """Test that only outcome writes that reach the workbook are counted."""
+        template_path = tmp_path / "template.xlsx"
+        template = Workbook()
+        template.active.title = "Daten"
+        template.save(template_path)
+        source = tmp_path / "source.xlsx"
+        source.touch()
+        writes = [
+            ("Daten", "C56", "gut", True),
+            ("Daten", "D56", "Beschreibung", False),
+            ("Daten", "not a cell", "gut", True),
+            ("Daten", "C4", "Test Institute Ltd.", False),
+        ]
+
+        result = _render_recorded_report(template_path, source, tmp_path / "out.xlsx", writes)
+
+        assert result == 1
+        assert load_workbook(tmp_path / "out.xlsx")["Daten"]["C56"].value == "gut"
+
+    def test_recorded_report_missing_source(self, tmp_path):
+        """Test that a worker reports a vanished source file like generate_report."""
+        template_path = tmp_path / "template.xlsx"
+        Workbook().save(template_path)
+
+        result = _render_recorded_report(
+            template_path, tmp_path / "missing.xlsx", tmp_path / "out.xlsx", []
+        )
+
+        assert result is None
+        assert not (tmp_path / "out.xlsx").exists()
@@ -5,13 +5,20 @@ Individual checks are subject to change, so we only test:
 - That we can retrieve registered checks
 - That check execution works correctly
 - That the check interface is consistent
+- That checks read the workbook the way the template is laid out, through the
+  public check functions on small in-memory workbooks
 """
 
+import threading
+from datetime import datetime
+
 import pytest
-from openpyxl import Workbook
+from openpyxl import Workbook, load_workbook
 
+from orsa_analysis.checks import rules
 from orsa_analysis.checks.rules import (
     get_all_checks,
+    run_all_checks,
     run_check,
 )
 
@@ -32,11 +39,12 @@ def basic_workbook():
 class TestGetAllChecks:
     """Test cases for retrieving registered checks."""
 
-    def test_get_all_checks_returns_list(self):
-        """Test that get_all_checks returns a list."""
+    def test_get_all_checks_returns_tuple(self):
+        """Test that get_all_checks returns the immutable registry."""
         checks = get_all_checks()
-        assert isinstance(checks, list)
+        assert isinstance(checks, tuple)
         assert len(checks) > 0
+        assert checks is get_all_checks()
 
     def test_get_all_checks_format(self):
         """Test that each check is a tuple of (name, function)."""
@@ -120,3 +128,428 @@ class TestRunCheck:
                 assert len(result) == 3, f"Check '{check_name}' should return a 3-tuple"
             except Exception as e:
                 pytest.fail(f"Check '{check_name}' raised unexpected exception: {e}")
+
+    def test_run_all_checks(self, basic_workbook):
+        """Test that run_all_checks matches running each check individually."""
+        outcomes = run_all_checks(basic_workbook)
+
+        assert outcomes == [
+            (check_name, *run_check(check_name, check_function, basic_workbook))
+            for check_name, check_function in get_all_checks()
+        ]
+
+
+class TestReadOnlyWorkbook:
+    """Test cases for running the checks on read-only workbooks."""
+
+    def test_same_outcomes_as_loaded_workbook(self, tmp_path):
+        """Test that a read-only workbook gives the same outcomes, also for rows past its end."""
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Risiken"
+        ws["E22"] = "(1) Finanzmarktrisiko"
+        file_path = tmp_path / "read_only.xlsx"
+        wb.save(file_path)
+
+        read_only_wb = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            assert run_all_checks(read_only_wb) == run_all_checks(wb)
+        finally:
+            read_only_wb.close()
+
+
+class TestOrsaVersion:
+    """Test cases for the version detection."""
+
+    @pytest.mark.parametrize(
+        "title, expected",
+        [("Ergebnisse", "Zweigniederlassung"), ("Résultats", "Zweigniederlassung"), ("Ergebnisse_IFRS", "Sitzgesellschaft")],
+    )
+    def test_detects_version(self, title, expected):
+        """Test that only the branch results sheet marks a Zweigniederlassung."""
+        wb = Workbook()
+        wb.active.title = title
+
+        assert rules.check_orsa_version(wb)[1] == expected
+
+
+class TestSheetLanguages:
+    """Test cases for checks on translated workbooks."""
+
+    def test_resolves_translated_sheet(self):
+        """Test that checks find their sheet in an English workbook."""
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Measures"
+        ws["E22"] = "(1) Financial market risk"
+        wb.create_sheet("Scenarios")
+
+        assert rules.check_finanzmarktrisiko_count(wb)[1] == "1"
+
+
+class TestRiskCriteria:
+    """Test cases for the risk criteria check."""
+
+    def test_collects_criteria_prefixes(self):
+        """Test that each selected criterion is found once by its prefix."""
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Risiken"
+        ws["E10"] = "(1) Eintrittswahrscheinlichkeit"
+        ws["E11"] = "(2) Auswirkung"
+        ws["E12"] = "(2) Auswirkung"
+        ws["E16"] = "(5) Andere"
+        ws["E17"] = "(3) outside of the criteria rows"
+
+        outcome, outcome_str, description = rules.check_risk_criteria_sufficient(wb)
+
+        assert "Gefunden: (1), (2), (5)" in description
+
+
+class TestRiskCounts:
+    """Test cases for the risk category counts."""
+
+    def test_counts_by_prefix(self):
+        """Test that only E22:E51 is counted, per category."""
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Risiken"
+        ws["E22"] = "(1) Finanzmarktrisiko"
+        ws["E23"] = "(1) Finanzmarktrisiko"
+        ws["E30"] = "(7) Anderes Risiko"
+        ws["E52"] = "(2) outside of the risk table"
+
+        assert rules.check_finanzmarktrisiko_count(wb)[1] == "2"
+        assert rules.check_anderes_risiko_count(wb)[1] == "1"
+        assert rules.check_versicherungsrisiko_count(wb)[1] == "0"
+
+
+class TestMeasureCounts:
+    """Test cases for the Massnahmen category counts."""
+
+    @pytest.fixture
+    def measures_workbook(self):
+        """Create a workbook with a few categorised measures."""
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Massnahmen"
+        ws["E9"] = "(1) Risikobegrenzend"
+        ws["E10"] = "(5) Andere Wirkung"
+        ws["G10"] = "(6) Risiko akzeptiert"
+        ws["F44"] = "(4) Andere Wirkung"
+        ws["F57"] = "(4) Andere Wirkung"
+        ws["F54"] = "(4) between the two tables"
+        ws["E39"] = 5
+        return wb
+
+    def test_counts_per_column(self, measures_workbook):
+        """Test that each check counts the categories of its own range."""
+        assert rules.check_count_number_mitigating_measures(measures_workbook)[1] == "2"
+        assert rules.check_count_number_potential_mitigating_measures(measures_workbook)[1] == "0"
+        assert rules.check_count_number_other_measures_other_effect(measures_workbook)[1] == "2"
+
+    def test_missing_sheet(self, basic_workbook):
+        """Test that a workbook without Massnahmen sheet counts no measures."""
+        outcome, outcome_str, description = rules.check_count_number_mitigating_measures(basic_workbook)
+
+        assert outcome_str == "0"
+        assert "nicht gefunden" in description
+
+
+class TestScenarioCounts:
+    """Test cases for the scenario type, event and risk counts."""
+
+    def test_counts_type_cells(self):
+        """Test that only the scenario type cells are counted."""
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Szenarien"
+        ws["C10"] = "(1) Advers"
+        ws["C34"] = "(2) Existenzbedrohend"
+        ws["C58"] = "(1) Advers"
+        ws["C346"] = "Ohne Typ"
+        ws["C11"] = "(3) not a type cell"
+
+        assert rules.check_count_all_scenarios(wb)[1] == "4"
+        assert rules.check_count_advers_scenarios(wb)[1] == "2"
+        assert rules.check_count_existenzbedrohend_scenarios(wb)[1] == "1"
+        assert rules.check_count_other_scenarios(wb)[1] == "0"
+
+    def test_events_and_risks_per_defined_scenario(self):
+        """Test that events and risks are counted for defined scenarios only."""
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Szenarien"
+        ws["C10"] = "(1) Advers"
+        ws["C14"] = "Ereignis 1"
+        ws["C20"] = "Risiko 1"
+        ws["C29"] = "Risiko 2"
+        ws["C34"] = "(2) Existenzbedrohend"
+        ws["C40"] = "Ereignis ohne Risiko"
+        ws["C62"] = "Ereignis eines undefinierten Szenarios"
+
+        assert rules.check_every_scenario_has_event(wb)[0] is True
+        assert rules.check_every_scenario_has_risk(wb)[0] is False
+        assert rules.check_count_scenrios_multiple_risks(wb)[1] == "1"
+
+    def test_missing_sheet(self, basic_workbook):
+        """Test that a missing Szenarien sheet counts no scenarios."""
+        assert rules.check_count_other_scenarios(basic_workbook)[1] == "0"
+
+
+class TestDefinedScenarios:
+    """Test cases for the defined scenario indices."""
+
+    def test_only_filled_type_cells(self):
+        """Test that only scenarios with a type cell need results."""
+        wb = Workbook()
+        wb.remove(wb.active)
+        szenarien = wb.create_sheet("Szenarien")
+        szenarien["C10"] = "(1) Advers"
+        szenarien["C38"] = "Ereignis ohne Szenariotyp"
+        szenarien["C346"] = "(3) Sonstiges"
+        wb.create_sheet("Ergebnisse_AVO-FINMA")
+        results = wb.create_sheet("Ergebnisse_IFRS")
+        results["E26"] = 100
+        for col in "KLM":
+            results[f"{col}88"] = 1
+
+        outcome, _, description = rules.check_scenarios_liquidity_filled_three_years(wb)
+
+        assert outcome is False
+        assert "Szenario 15 " in description
+
+    def test_missing_sheet_is_zu_pruefen(self):
+        """Test that scenario results without a Szenarien sheet need a manual review."""
+        wb = Workbook()
+        wb.active.title = "Ergebnisse_IFRS"
+        wb.active["E26"] = 100
+
+        outcome, outcome_str, description = run_check(
+            "check_scenarios_liquidity_filled_three_years", rules.check_scenarios_liquidity_filled_three_years, wb
+        )
+
+        assert outcome is False
+        assert outcome_str == rules.STR_ZU_PRUEFEN
+        assert "'Szenarien' wurde in der Arbeitsmappe nicht gefunden" in description
+
+
+class TestDataRecency:
+    """Test cases for the recency checks on Allgem. Angaben."""
+
+    @pytest.mark.parametrize(
+        "snapshot, approved, expected",
+        [
+            ("31.12.2024", "30.06.2025", "5 Monate"),
+            (" 31.12.2024 ", "01.07.2025", "6 Monate"),
+            ("1.2.2024", "14.03.2024", "1 Monate"),
+            (datetime(2024, 1, 15), "14.08.2024", "6 Monate"),
+            ("15.01.2024", "15.08.2024", "7 Monate"),
+        ],
+    )
+    def test_counts_completed_months(self, snapshot, approved, expected):
+        """Test that dates and DD.MM.YYYY strings are compared in completed months."""
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Allgem. Angaben"
+        ws["C14"] = snapshot
+        ws["C17"] = approved
+
+        outcome, _, description = rules.check_data_recency_geschaeftsplanung(wb)
+
+        assert expected in description
+        assert outcome is (expected != "7 Monate")
+
+    @pytest.fixture
+    def dates_workbook(self):
+        """Create a workbook with snapshot dates and an approval date."""
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Allgem. Angaben"
+        ws["C14"] = "31.12.2024"
+        ws["C15"] = datetime(2024, 3, 31)
+        ws["C16"] = "31.02.2025"
+        ws["C17"] = "30.04.2025"
+        return wb
+
+    def test_each_check_uses_its_snapshot(self, dates_workbook):
+        """Test that the three checks only differ in the snapshot cell."""
+        assert rules.check_data_recency_geschaeftsplanung(dates_workbook)[0] is True
+        assert rules.check_data_recency_risikoidentifikation(dates_workbook)[0] is False
+
+    def test_invalid_snapshot_only_fails_own_check(self, dates_workbook):
+        """Test that an invalid date is reported by its own check."""
+        outcome, outcome_str, description = rules.check_data_recency_szenarien(dates_workbook)
+
+        assert outcome is False
+        assert outcome_str == rules.STR_UNGENUEGEND
+        assert "fehlgeschlagen" in description
+        assert rules.check_data_recency_geschaeftsplanung(dates_workbook)[0] is True
+
+
+class TestOrsaDokumentation:
+    """Test cases for the documentation rating classification."""
+
+    @staticmethod
+    def _workbook(ratings):
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Schlussfolgerungen, Dokument."
+        for row, rating in enumerate(ratings, start=24):
+            ws[f"C{row}"] = rating
+        return wb
+
+    def test_all_documented(self):
+        """Test that seven (2) ratings are sufficient."""
+        wb = self._workbook(["(2) Dokumentiert"] * 7)
+        assert rules.check_orsa_dokumentation_sufficient(wb)[:2] == (True, "genügend")
+
+    def test_any_not_covered(self):
+        """Test that a single (3) rating outweighs all others."""
+        wb = self._workbook(["(2) Dokumentiert"] * 6 + ["(3) Nicht behandelt"])
+        assert rules.check_orsa_dokumentation_sufficient(wb)[:2] == (False, "ungenügend")
+
+    def test_non_text_cells_are_not_ratings(self):
+        """Test that numbers and empty cells count as missing ratings."""
+        wb = self._workbook(["(2) Dokumentiert"] * 5 + [2, None])
+        assert rules.check_orsa_dokumentation_sufficient(wb)[:2] == (False, "mangelhaft")
+
+
+class TestResultChecks:
+    """Test cases for the completeness checks on the results sheets."""
+
+    @pytest.fixture
+    def ifrs_workbook(self):
+        """Create a workbook where only the IFRS results are filled."""
+        wb = Workbook()
+        wb.remove(wb.active)
+        wb.create_sheet("Ergebnisse_AVO-FINMA")
+        ws = wb.create_sheet("Ergebnisse_IFRS")
+        ws["E26"] = 100
+        return wb
+
+    def test_both_sheets_filled(self, ifrs_workbook):
+        """Test that figures on both results sheets are reported."""
+        ifrs_workbook["Ergebnisse_AVO-FINMA"]["F26"] = 100
+
+        outcome, outcome_str, _ = rules.check_provisions_filled_three_years(ifrs_workbook)
+
+        assert outcome is False
+        assert "Both result sheets" in outcome_str
+
+    def test_uses_layout_rows(self, ifrs_workbook):
+        """Test that the IFRS rows are checked for the provisions."""
+        ws = ifrs_workbook["Ergebnisse_IFRS"]
+        for col in "EFG":
+            ws[f"{col}73"] = 1
+
+        assert rules.check_provisions_filled_three_years(ifrs_workbook)[0] is True
+
+    @pytest.mark.parametrize("value, expected", [(0, True), (datetime(2025, 1, 1), True), ("  ", False), (None, False)])
+    def test_blank_cells_are_empty(self, ifrs_workbook, value, expected):
+        """Test that only None and blank strings count as missing figures."""
+        ws = ifrs_workbook["Ergebnisse_IFRS"]
+        ws["E73"] = 1
+        ws["F73"] = 1
+        ws["G73"] = value
+
+        assert rules.check_provisions_filled_three_years(ifrs_workbook)[0] is expected
+
+    def test_partial_other_perspective_row(self, ifrs_workbook):
+        """Test that the shifted IFRS row is reported for a partial entry."""
+        ifrs_workbook["Ergebnisse_IFRS"]["E76"] = 1
+
+        outcome, _, desc = rules.check_other_perspective_filled_three_years(ifrs_workbook)
+
+        assert outcome is False
+        assert "Zeile 76" in desc
+
+
+class TestSheetBlockRanges:
+    """Test cases for checks reading rows outside their sheet block."""
+
+    def test_short_block_is_zu_pruefen(self, monkeypatch):
+        """Test that a block range missing rows fails the check instead of dropping them."""
+        monkeypatch.setitem(rules._SHEET_BLOCKS, "Risiken", (7, 40, "B", "E"))
+        wb = Workbook()
+        wb.active.title = "Risiken"
+        wb.create_sheet("Massnahmen")
+
+        outcome, outcome_str, _ = run_check(
+            "check_risks_are_all_mitigated", rules.check_risks_are_all_mitigated, wb
+        )
+
+        assert outcome is False
+        assert outcome_str == rules.STR_ZU_PRUEFEN
+
+
+class TestRunScope:
+    """Test cases for values shared between the checks of one run."""
+
+    @pytest.fixture
+    def risks_workbook(self):
+        """Create a workbook with one financial market risk."""
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Risiken"
+        ws["E22"] = "(1) Finanzmarktrisiko"
+        return wb
+
+    def test_direct_check_reads_current_cells(self, risks_workbook):
+        """Test that a check sees cells changed after an earlier call."""
+        assert rules.check_finanzmarktrisiko_count(risks_workbook)[1] == "1"
+
+        risks_workbook["Risiken"]["E23"] = "(1) y"
+
+        assert rules.check_finanzmarktrisiko_count(risks_workbook)[1] == "2"
+
+    def test_direct_check_sees_renamed_sheet(self, risks_workbook):
+        """Test that a check resolves sheets again after a rename."""
+        before = rules.check_count_number_mitigating_measures(risks_workbook)
+        assert "nicht gefunden" in before[2]
+
+        ws = risks_workbook.create_sheet("Tabelle")
+        ws["E9"] = "(1) Massnahme"
+        ws.title = "Massnahmen"
+
+        assert rules.check_count_number_mitigating_measures(risks_workbook)[1] == "1"
+
+    def test_run_all_checks_reads_current_cells(self, risks_workbook):
+        """Test that consecutive runs on a modified workbook differ."""
+        first = dict((name, outcome_str) for name, _, outcome_str, _ in run_all_checks(risks_workbook))
+
+        risks_workbook["Risiken"]["E23"] = "(1) y"
+        second = dict((name, outcome_str) for name, _, outcome_str, _ in run_all_checks(risks_workbook))
+
+        assert first["check_finanzmarktrisiko_count"] == "1"
+        assert second["check_finanzmarktrisiko_count"] == "2"
+
+    def test_concurrent_runs_keep_their_values(self, risks_workbook, monkeypatch):
+        """Test that a run in another thread does not end the shared values of a running one."""
+        other_done = threading.Event()
+
+
+        def modify_and_wait(wb):
+            if wb is not risks_workbook:
+                return True, "", ""
+            wb["Risiken"]["E23"] = "(1) y"
+            other_thread = threading.Thread(target=run_all_checks, args=(Workbook(),))
+            other_thread.start()
+            other_thread.join()
+            other_done.set()
+            return True, "", ""
+
+        monkeypatch.setattr(
+            rules,
+            "REGISTERED_CHECKS",
+            [
+                ("before", rules.check_finanzmarktrisiko_count),
+                ("modify", modify_and_wait),
+                ("after", rules.check_finanzmarktrisiko_count),
+            ],
+        )
+
+        results = {name: outcome_str for name, _, outcome_str, _ in run_all_checks(risks_workbook)}
+
+        assert other_done.is_set()
+        assert results["before"] == results["after"] == "1"
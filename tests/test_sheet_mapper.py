@@ -48,6 +48,17 @@ class TestSheetNameMapper:
         mapper = SheetNameMapper(wb)
         assert mapper.detected_language == "FR"
 
+    def test_sheetnames_set(self):
+        """Test that the sheet name set is built once and reused."""
+        wb = Workbook()
+        wb.remove(wb.active)
+        wb.create_sheet("Risiken")
+        wb.create_sheet("Ergebnisse_IFRS")
+
+        mapper = SheetNameMapper(wb)
+        assert mapper.sheetnames_set == {"Risiken", "Ergebnisse_IFRS"}
+        assert mapper.sheetnames_set is mapper.sheetnames_set
+
     def test_get_sheet_name_german(self):
         """Test getting sheet name from German reference in German workbook."""
         wb = Workbook()
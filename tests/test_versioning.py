@@ -1,5 +1,6 @@
 """Unit tests for the versioning module."""
 
+import hashlib
 import pytest
 from pathlib import Path
 
@@ -53,6 +54,43 @@ class TestVersionManager:
 
         assert hash1 != hash2
 
+    def test_compute_file_hash_matches_sha256(self, version_manager, sample_file):
+        """Test that the hash equals a plain SHA-256 of the file content."""
+        expected = hashlib.sha256(sample_file.read_bytes()).hexdigest()
+
+        assert version_manager.compute_file_hash(sample_file) == expected
+
+    def test_compute_file_hash_chunked_fallback(
+        self, version_manager, sample_file, monkeypatch
+    ):
+        """Test the chunked fallback used when hashlib.file_digest is missing."""
+        expected = hashlib.sha256(sample_file.read_bytes()).hexdigest()
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+
+        assert version_manager.compute_file_hash(sample_file) == expected
+
+    def test_compute_file_hash_reuses_unchanged_file(
+        self, version_manager, sample_file, monkeypatch
+    ):
+        """Test that an unchanged file is not read again."""
+        hash1 = version_manager.compute_file_hash(sample_file)
+
+        def fail_open(*args, **kwargs):
+            raise AssertionError("unchanged file should not be re-read")
+
+        monkeypatch.setattr("builtins.open", fail_open)
+        hash2 = version_manager.compute_file_hash(sample_file)
+
+        assert hash1 == hash2
+
+    def test_compute_file_hash_detects_modification(self, version_manager, sample_file):
+        """Test that a modified file is hashed again."""
+        hash1 = version_manager.compute_file_hash(sample_file)
+        sample_file.write_text("Modified content of a different length")
+        hash2 = version_manager.compute_file_hash(sample_file)
+
+        assert hash1 != hash2
+
     def test_compute_file_hash_not_found(self, version_manager):
         """Test computing hash of non-existent file."""
         with pytest.raises(FileNotFoundError):